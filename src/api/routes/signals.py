@@ -211,6 +211,9 @@ async def test_signal(signal_id: UUID, user: dict = Depends(get_current_user)):
 
         # Evaluate signal
         matched_data = await evaluate_signal(pool, signal, UUID(user["org_id"]))
+        if matched_data:
+            # Checks return raw asyncpg Records; the response model needs dicts
+            matched_data["matches"] = [dict(row) for row in matched_data["matches"]]
 
         return SignalTestResponse(
             signal_id=signal_id,
@@ -7,6 +7,13 @@ import os
 import asyncpg
 import bcrypt
 
+# A migration whose first line is this directive runs statement by statement
+# outside a transaction (needed for CREATE INDEX CONCURRENTLY). Such files must
+# not contain ';' inside a statement.
+NO_TRANSACTION_DIRECTIVE = "-- migrate:no-transaction"
+# Table rewrites and index builds on large tables outlast the pool's 30s default
+MIGRATION_TIMEOUT_SECONDS = 60 * 60
+
 
 def get_db_url() -> str:
     """Get database URL with postgres:// to postgresql:// conversion."""
@@ -39,7 +46,11 @@ async def run_migrations() -> None:
         if not exists:
             with open(path) as f:
                 sql = f.read()
-            await pool.execute(sql)
+            if sql.startswith(NO_TRANSACTION_DIRECTIVE):
+                for statement in _split_statements(sql):
+                    await pool.execute(statement, timeout=MIGRATION_TIMEOUT_SECONDS)
+            else:
+                await pool.execute(sql, timeout=MIGRATION_TIMEOUT_SECONDS)
             await pool.execute("INSERT INTO _migrations (name) VALUES ($1)", name)
             print(f"Applied: {name}")
         else:
@@ -53,6 +64,12 @@ async def run_migrations() -> None:
     print("Migrations complete.")
 
 
+def _split_statements(sql: str) -> list[str]:
+    """Split a no-transaction migration into its individual statements."""
+    lines = [line for line in sql.splitlines() if not line.lstrip().startswith("--")]
+    return [stmt.strip() for stmt in "\n".join(lines).split(";") if stmt.strip()]
+
+
 async def _ensure_admin_password(pool: asyncpg.Pool) -> None:
     """Set/fix admin password from ADMIN_PASSWORD env var on every boot."""
     admin_email = os.environ.get("ADMIN_EMAIL", "admin@lakeb2b.internal")
@@ -0,0 +1,24 @@
+-- Migration 024: Stored columns for the signal checks' substring matches
+--
+-- job_title: check_job_change_signal filters contacts with job_title ILIKE,
+-- which would otherwise extract metadata->>'job_title' for every candidate row.
+--
+-- tech_text: check_tech_stack_signal matches a technology as a substring of the
+-- page's platform or technology (ILIKE '%x%'), so "react" still matches
+-- "react-dom" and "ReactJS". The newline separator keeps a pattern from
+-- matching across the two values.
+--
+-- Both columns are added in one ALTER TABLE, so scraped_data is rewritten
+-- once. The rewrite holds ACCESS EXCLUSIVE on scraped_data (reads and writes
+-- block) for the time it takes to copy the table and rebuild its indexes.
+-- Their trigram indexes are built concurrently by migration 025.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE scraped_data
+    ADD COLUMN IF NOT EXISTS job_title TEXT
+        GENERATED ALWAYS AS (metadata->>'job_title') STORED,
+    ADD COLUMN IF NOT EXISTS tech_text TEXT
+        GENERATED ALWAYS AS (
+            coalesce(metadata->>'platform', '') || E'\n' || coalesce(metadata->>'technology', '')
+        ) STORED;
@@ -0,0 +1,41 @@
+-- migrate:no-transaction
+-- Migration 025: Indexes tuned to the intent-signal check queries
+--
+-- Each check in src/services/signal_evaluator.py filters scraped_data by
+-- (org_id, data_type, recent scraped_at) and then by a metadata field or one
+-- of the stored columns from migration 024. Without matching indexes these
+-- fall back to sequential scans.
+--
+-- scraped_data is large, so the indexes are built CONCURRENTLY: writes keep
+-- flowing while each index builds. The no-transaction directive above makes
+-- src/db/migrate.py run each statement on its own, since CONCURRENTLY can't
+-- run inside a transaction. If a build fails it leaves an INVALID index that
+-- IF NOT EXISTS would skip; drop it before re-running the migration.
+
+-- 1. Partial (org_id, scraped_at DESC) indexes, one per data_type a check reads
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sd_contact_recent
+    ON scraped_data (org_id, scraped_at DESC) WHERE data_type = 'contact';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sd_tech_stack_recent
+    ON scraped_data (org_id, scraped_at DESC) WHERE data_type = 'tech_stack';
+
+-- The hiring-spike check groups these rows by domain; INCLUDE (domain) lets
+-- it run as an index-only scan with no heap fetches
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sd_jobpost_recent_domain
+    ON scraped_data (org_id, scraped_at DESC) INCLUDE (domain)
+    WHERE data_type = 'job_posting';
+
+-- 2. Funding announcements are identified by metadata, not data_type
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sd_meta_type_funding
+    ON scraped_data (org_id, scraped_at)
+    WHERE metadata->>'type' = 'funding' OR metadata->>'category' = 'funding';
+
+-- 3. Trigram indexes so the job-change and tech-stack ILIKE '%...%' matches
+--    can use an index
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sd_job_title_trgm
+    ON scraped_data USING GIN (job_title gin_trgm_ops)
+    WHERE data_type = 'contact';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sd_tech_text_trgm
+    ON scraped_data USING GIN (tech_text gin_trgm_ops)
+    WHERE data_type = 'tech_stack';
@@ -10,7 +10,11 @@ async def get_pool() -> asyncpg.Pool:
     if _pool is None:
         settings = get_settings()
         _pool = await asyncpg.create_pool(
-            settings.database_url, min_size=0, max_size=10, command_timeout=10
+            settings.database_url,
+            min_size=settings.db_pool_min_size,
+            max_size=settings.db_pool_max_size,
+            command_timeout=10,
+            statement_cache_size=settings.db_statement_cache_size,
         )
     return _pool
 
@@ -5,6 +5,12 @@ import asyncpg
 
 from src.models.scraped_data import ScrapedData
 
+# One reusable encoder for metadata JSONB: json.dumps builds a new encoder on
+# every call when given options, and jsonb discards whitespace anyway.
+_encode_metadata = json.JSONEncoder(
+    default=str, separators=(",", ":"), check_circular=False
+).encode
+
 _UPSERT_SQL = """
     INSERT INTO scraped_data
         (id, job_id, domain, data_type, url, title, metadata, org_id, user_id)
@@ -40,7 +46,7 @@ async def insert_scraped_data(
         data_type,
         url,
         title,
-        json.dumps(metadata or {}),
+        _encode_metadata(metadata or {}),
         org_id,
         None,  # user_id
     )
@@ -69,7 +75,7 @@ async def batch_insert_scraped_data(
                 rec["data_type"],
                 rec.get("url"),
                 rec.get("title"),
-                json.dumps(rec.get("metadata", {}), default=str),
+                _encode_metadata(rec.get("metadata", {})),
                 rec.get("org_id"),
                 rec.get("user_id"),
             )
@@ -1,11 +1,13 @@
 """Database queries for signals and signal executions."""
 
+import json
 from typing import Any
 from uuid import UUID
 
 from asyncpg import Pool
 
 from src.models.signals import Signal, SignalExecution, SignalType
+from src.utils.serialize import json_default
 
 # ============================================================================
 # Signal Type Queries
@@ -121,6 +123,25 @@ async def get_active_signals(pool: Pool, org_id: UUID | None = None) -> list[Sig
     return [Signal(**dict(row)) for row in rows]
 
 
+async def get_active_signals_grouped_by_org(pool: Pool) -> dict[UUID, list[Signal]]:
+    """Get all active signals in one query, grouped by org.
+
+    Within each org, signals keep the created_at DESC order of get_active_signals.
+    """
+    query = """
+        SELECT * FROM signals
+        WHERE is_active = TRUE
+        ORDER BY org_id, created_at DESC
+    """
+    rows = await pool.fetch(query)
+
+    grouped: dict[UUID, list[Signal]] = {}
+    for row in rows:
+        signal = Signal(**dict(row))
+        grouped.setdefault(signal.org_id, []).append(signal)
+    return grouped
+
+
 async def update_signal(
     pool: Pool,
     signal_id: UUID,
@@ -222,23 +243,62 @@ async def create_signal_execution(
             signal_id, org_id, trigger_data,
             action_type, action_status, action_response, error_message
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7)
+        VALUES ($1, $2, $3::jsonb, $4, $5, $6::jsonb, $7)
         RETURNING *
     """
     row = await pool.fetchrow(
         query,
         signal_id,
         org_id,
-        trigger_data,
+        json.dumps(trigger_data, default=json_default),
         action_type,
         action_status,
-        action_response,
+        json.dumps(action_response) if action_response is not None else None,
         error_message,
     )
     assert row is not None
     return SignalExecution(**dict(row))
 
 
+# Execution log + fire-count bump as one statement (one round trip per fire)
+_SIGNAL_POSTFIRE_SQL = """
+    WITH ins AS (
+        INSERT INTO signal_executions (
+            signal_id, org_id, trigger_data,
+            action_type, action_status, action_response, error_message
+        )
+        VALUES ($1, $2, $3::jsonb, $4, $5, $6::jsonb, $7)
+    )
+    UPDATE signals
+    SET fire_count = fire_count + 1,
+        last_fired_at = NOW()
+    WHERE id = $1
+"""
+
+
+async def record_signal_fire(
+    pool: Pool,
+    signal_id: UUID,
+    org_id: UUID,
+    trigger_data: dict[str, Any],
+    action_type: str,
+    action_status: str,
+    action_response: dict[str, Any] | None = None,
+    error_message: str | None = None,
+) -> None:
+    """Log a signal execution and increment the signal's fire count."""
+    await pool.execute(
+        _SIGNAL_POSTFIRE_SQL,
+        signal_id,
+        org_id,
+        json.dumps(trigger_data, default=json_default),
+        action_type,
+        action_status,
+        json.dumps(action_response) if action_response is not None else None,
+        error_message,
+    )
+
+
 async def get_signal_execution_history(
     pool: Pool, signal_id: UUID, limit: int = 100
 ) -> list[SignalExecution]:
@@ -21,6 +21,18 @@ JOB_HARD_TIMEOUT_SECONDS = 5400
 log = structlog.get_logger()
 
 
+async def _trigger_signal_evaluation(ctx: dict, org_id: str | None) -> None:
+    """New data landed for this org: evaluate its signals now, not at the next sweep."""
+    if not org_id or not ctx.get("redis"):
+        return
+    from src.workers.signal_processor import enqueue_org_signal_evaluation
+
+    try:
+        await enqueue_org_signal_evaluation(ctx["redis"], org_id)
+    except Exception as e:
+        log.warning("signal_eval_enqueue_failed", org_id=org_id, error=str(e))
+
+
 async def process_scrape_job(
     ctx: dict,
     *,
@@ -199,6 +211,8 @@ async def process_scrape_job(
                     completed_at=datetime.now(),
                 )
 
+                await _trigger_signal_evaluation(ctx, org_id)
+
                 # 5. Check if domain is tracked and has webhook configured
                 from src.db.queries.tracked_domains import get_tracked_domain
                 from src.services.webhook_export import export_job_to_webhook
@@ -342,6 +356,7 @@ async def process_linkedin_scrape_job(
                 pages_scraped=total_data,
                 completed_at=datetime.now(),
             )
+            await _trigger_signal_evaluation(ctx, org_id)
         else:
             await job_queries.update_job_status(
                 pool, uid, JobStatus.FAILED,
@@ -425,6 +440,7 @@ async def process_apollo_scrape_job(
                 pages_scraped=total_data,
                 completed_at=datetime.now(),
             )
+            await _trigger_signal_evaluation(ctx, org_id)
         else:
             await job_queries.update_job_status(
                 pool, uid, JobStatus.FAILED,
@@ -1,6 +1,7 @@
 import structlog
 from arq.connections import RedisSettings
 from arq.cron import cron
+from arq.worker import func
 
 from src.config.settings import get_settings
 from src.queue.discover_jobs import check_tracked_searches, process_discovery_job
@@ -10,7 +11,7 @@ from src.queue.jobs import (
     process_scrape_job,
 )
 from src.workers.scheduled_scraper import check_scheduled_scrapes
-from src.workers.signal_processor import process_signals
+from src.workers.signal_processor import evaluate_org_signals, process_signals
 
 log = structlog.get_logger()
 
@@ -54,7 +55,10 @@ async def cleanup_stale_data_cron(ctx: dict) -> None:
 
 async def shutdown(ctx: dict) -> None:
     from src.db.pool import close_pool
+    from src.services.signal_evaluator import drain_background_tasks
 
+    # Finish pending signal fire records before the pool goes away
+    await drain_background_tasks()
     await close_pool()
 
 
@@ -64,12 +68,15 @@ class WorkerSettings:
         process_discovery_job,
         process_linkedin_scrape_job,
         process_apollo_scrape_job,
+        # No stored result, so the per-org job id frees up as soon as it finishes
+        func(evaluate_org_signals, keep_result=0),
     ]
     on_startup = startup
     on_shutdown = shutdown
 
     # Run scheduled scrape checks every hour at :00
-    # Run signal evaluation every 15 minutes
+    # Run the signal evaluation sweep every 15 minutes (orgs are also evaluated
+    # right after each of their scrape jobs completes)
     # Run tracked search checks every 15 minutes (offset by 10 min)
     # Run data retention cleanup daily at 3:00 AM
     cron_jobs = [
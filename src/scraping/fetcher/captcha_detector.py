@@ -25,6 +25,19 @@ _CAPTCHA_PATTERNS = [
     re.compile(r'<script[^>]+src=["\'][^"\']*datadome', re.I),
 ]
 
+# Every pattern above contains one of these literals (case-insensitively).
+# Clean pages — the common case — are rejected with a few C-level substring
+# scans instead of running each regex over the whole document.
+_CAPTCHA_MARKERS = (
+    "captcha",
+    "data-sitekey",
+    "just a moment",
+    "cf-challenge-running",
+    "challenge-form",
+    "cf-turnstile",
+    "datadome",
+)
+
 
 def detect_captcha(html: str) -> bool:
     """Detect CAPTCHA/bot-check pages by scanning for known markers.
@@ -32,4 +45,7 @@ def detect_captcha(html: str) -> bool:
     Returns True only when specific CAPTCHA DOM elements or challenge scripts
     are found — NOT for pages that merely mention the word 'captcha'.
     """
+    folded = html.casefold()
+    if not any(marker in folded for marker in _CAPTCHA_MARKERS):
+        return False
     return any(p.search(html) for p in _CAPTCHA_PATTERNS)
@@ -1,8 +1,7 @@
-import asyncio
 import time
 
 import structlog
-from scrapling.fetchers import Fetcher
+from scrapling.fetchers import AsyncFetcher
 
 from src.config.constants import TIER_COSTS
 from src.config.settings import get_settings
@@ -26,7 +25,7 @@ class LakeLightPandaFetcher:
     """
 
     def __init__(self):
-        self._http_fetcher = Fetcher()
+        self._http_fetcher = AsyncFetcher()
 
     async def fetch(self, url: str, options: FetchOptions | None = None) -> FetchResult:
         settings = get_settings()
@@ -119,11 +118,8 @@ class LakeLightPandaFetcher:
         start = time.time()
 
         try:
-            response = await asyncio.to_thread(
-                self._http_fetcher.get,
-                url,
-                timeout=options.timeout / 1000,
-            )
+            # Native async client: no worker-thread hop per request
+            response = await self._http_fetcher.get(url, timeout=options.timeout / 1000)
             html = response.html_content
             status_code = response.status
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import time
 from typing import Any
@@ -31,6 +32,15 @@ class LakePlaywrightFetcher:
 
     def __init__(self):
         self._redis_client: redis.Redis | None = None
+        # One fetcher is shared by a worker's concurrent page tasks
+        self._redis_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close the session-store Redis client, if one was opened."""
+        async with self._redis_lock:
+            if self._redis_client is not None:
+                await self._redis_client.aclose()
+                self._redis_client = None
 
     async def fetch(self, url: str, options: FetchOptions | None = None) -> FetchResult:
         """Fetch URL with session persistence via Playwright browser context.
@@ -205,9 +215,10 @@ class LakePlaywrightFetcher:
         Returns:
             Redis client instance (cached after first call)
         """
-        if self._redis_client is None:
-            settings = get_settings()
-            self._redis_client = redis.from_url(settings.redis_url)
+        async with self._redis_lock:
+            if self._redis_client is None:
+                settings = get_settings()
+                self._redis_client = redis.from_url(settings.redis_url)
         return self._redis_client
 
     async def _load_session(self, client: redis.Redis, domain: str) -> dict[str, Any] | None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from typing import Any
@@ -71,6 +72,15 @@ class LakePlaywrightProxyFetcher:
 
     def __init__(self):
         self._redis_client: redis.Redis | None = None
+        # One fetcher is shared by a worker's concurrent page tasks
+        self._redis_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close the session-store Redis client, if one was opened."""
+        async with self._redis_lock:
+            if self._redis_client is not None:
+                await self._redis_client.aclose()
+                self._redis_client = None
 
     async def fetch(
         self, url: str, options: FetchOptions | None = None,
@@ -293,9 +303,10 @@ class LakePlaywrightProxyFetcher:
         return chain
 
     async def _get_redis_client(self) -> redis.Redis:
-        if self._redis_client is None:
-            settings = get_settings()
-            self._redis_client = redis.from_url(settings.redis_url)
+        async with self._redis_lock:
+            if self._redis_client is None:
+                settings = get_settings()
+                self._redis_client = redis.from_url(settings.redis_url)
         return self._redis_client
 
     async def _load_session(
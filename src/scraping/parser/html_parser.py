@@ -1,25 +1,24 @@
 from urllib.parse import urljoin
 
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 
 
 class HtmlParser:
-    """General-purpose HTML parser using selectolax."""
+    """General-purpose HTML parser using selectolax (lexbor backend)."""
 
     def __init__(self, html: str, base_url: str):
-        self.tree = HTMLParser(html)
+        self.tree = LexborHTMLParser(html)
         self.base_url = base_url
 
     def extract_title(self) -> str | None:
         """Extract page title."""
-        # Try <title> tag first
-        title_tag = self.tree.css_first("title")
-        if title_tag and title_tag.text():
-            return title_tag.text().strip()
-        # Try h1
-        h1 = self.tree.css_first("h1")
-        if h1 and h1.text():
-            return h1.text().strip()
+        # Try <title> tag first, then h1
+        for selector in ("title", "h1"):
+            node = self.tree.css_first(selector)
+            if node:
+                text = node.text()
+                if text:
+                    return text.strip()
         return None
 
     def extract_meta(self, name: str) -> str | None:
@@ -40,16 +39,24 @@ class HtmlParser:
         """Extract links matching CSS selectors."""
         base = base_url or self.base_url
         selectors = selectors or ["a[href]"]
+        seen_hrefs: set[str] = set()
+        seen: set[str] = set()
         urls: list[str] = []
 
         for selector in selectors:
             for node in self.tree.css(selector):
                 href = node.attributes.get("href")
-                if href and not href.startswith(("#", "mailto:", "tel:", "javascript:")):
-                    absolute = urljoin(base, href)
+                if not href or href in seen_hrefs:
+                    continue
+                seen_hrefs.add(href)
+                if href.startswith(("#", "mailto:", "tel:", "javascript:")):
+                    continue
+                absolute = urljoin(base, href)
+                if absolute not in seen:
+                    seen.add(absolute)
                     urls.append(absolute)
 
-        return list(dict.fromkeys(urls))
+        return urls
 
     def extract_text(self, selectors: list[str]) -> str | None:
         """Extract text content from the first matching selector."""
@@ -121,7 +128,7 @@ def extract_rich_metadata(html: str, url: str = "") -> dict:
     - favicon: Favicon URL
     - canonical_url: Canonical URL
     """
-    parser = HTMLParser(html)
+    parser = LexborHTMLParser(html)
     metadata = {}
 
     # Title
@@ -1,5 +1,25 @@
 from src.data.tech_signatures import TECH_SIGNATURES
 
+# Signature category -> key in the detect() result ("cms" sets "platform")
+_CATEGORY_KEYS = {
+    "analytics": "analytics",
+    "marketing": "marketing_tools",
+    "framework": "frameworks",
+    "cdn": "cdn",
+    "js_library": "js_libraries",
+}
+
+# The signature table is static: lowercase the signals and resolve categories
+# once at import instead of on every detect() call.
+_SIGNATURES: tuple[tuple[str, str | None, tuple[str, ...]], ...] = tuple(
+    (
+        sig["name"],
+        None if sig["category"] == "cms" else _CATEGORY_KEYS.get(sig["category"], ""),
+        tuple(s.lower() for s in sig["signals"]),
+    )
+    for sig in TECH_SIGNATURES
+)
+
 
 class TechParser:
     """Detects technology stack from HTML source and headers."""
@@ -7,6 +27,8 @@ class TechParser:
     def __init__(self, html: str, headers: dict[str, str] | None = None):
         self.html = html.lower()
         self.headers = {k.lower(): v.lower() for k, v in (headers or {}).items()}
+        # All header values in one string so each signal is one substring test
+        self._header_text = "\n".join(self.headers.values())
 
     def detect(self) -> dict:
         """Detect technologies and return categorized results."""
@@ -19,32 +41,18 @@ class TechParser:
             "cdn": [],
         }
 
-        for sig in TECH_SIGNATURES:
-            if self._matches(sig["signals"]):
-                category = sig["category"]
-                name = sig["name"]
-
-                if category == "cms":
+        for name, key, signals in _SIGNATURES:
+            if self._matches(signals):
+                if key is None:
                     result["platform"] = name  # type: ignore[assignment]
-                elif category == "analytics":
-                    result["analytics"].append(name)
-                elif category == "marketing":
-                    result["marketing_tools"].append(name)
-                elif category == "framework":
-                    result["frameworks"].append(name)
-                elif category == "cdn":
-                    result["cdn"].append(name)
-                elif category == "js_library":
-                    result["js_libraries"].append(name)
+                elif key:
+                    result[key].append(name)
 
         return result
 
-    def _matches(self, signals: list[str]) -> bool:
+    def _matches(self, signals: tuple[str, ...]) -> bool:
         """Check if any signal is present in HTML or headers."""
         for signal in signals:
-            if signal in self.html:
+            if signal in self.html or signal in self._header_text:
                 return True
-            for header_val in self.headers.values():
-                if signal in header_val:
-                    return True
         return False
@@ -29,9 +29,15 @@ class SearchResponse(BaseModel):
 class LakeCurrentClient:
     """Async client for LakeCurrent search API."""
 
-    def __init__(self, base_url: str, timeout: float = 15.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 15.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=timeout)
+        # transport is for tests (httpx.MockTransport); None uses the network
+        self._client = httpx.AsyncClient(timeout=timeout, transport=transport)
 
     async def search(
         self,
@@ -63,24 +63,27 @@ class RateLimiter:
             domain: Domain name to rate limit
             delay_ms: Optional explicit delay override (milliseconds)
         """
-        # Determine delay: explicit override > adaptive delay > domain-specific default
+        # Determine delay: explicit override > adaptive delay > domain-specific default,
+        # with default_delay_ms as a floor under the latter two
         if delay_ms is not None:
             delay = delay_ms / 1000.0
-        elif domain in self._current_delay:
-            delay = self._current_delay[domain]
         else:
-            # Use domain-specific rate limit as initial default
-            domain_limit_ms = self.get_rate_limit(domain)
-            delay = domain_limit_ms / 1000.0
-
-        last = self._last_request.get(domain, 0)
-        elapsed = time.time() - last
-        remaining = delay - elapsed
-
-        if remaining > 0:
-            await asyncio.sleep(remaining)
-
-        self._last_request[domain] = time.time()
+            if domain in self._current_delay:
+                delay = self._current_delay[domain]
+            else:
+                # Use domain-specific rate limit as initial default
+                domain_limit_ms = self.get_rate_limit(domain)
+                delay = domain_limit_ms / 1000.0
+            delay = max(delay, self._default_delay)
+
+        # Reserve the next slot before sleeping so concurrent callers for the
+        # same domain queue up one delay apart instead of all waking together.
+        now = time.time()
+        slot = max(now, self._last_request.get(domain, 0) + delay)
+        self._last_request[domain] = slot
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     def report_result(self, domain: str, status_code: int) -> None:
         """Adjust delay based on server response.
@@ -6,6 +6,7 @@ This module contains the core logic for evaluating intent signals:
 3. Log execution results
 """
 
+import asyncio
 import json
 from datetime import UTC, datetime
 from typing import Any
@@ -21,48 +22,100 @@ from src.db.pool import get_pool
 from src.db.queries.signals import (
     create_signal_execution,
     get_active_signals,
-    increment_signal_fire_count,
+    record_signal_fire,
 )
 from src.models.signals import Signal
+from src.utils.serialize import json_default
 
 log = structlog.get_logger()
 
+# Strong references to in-flight post-fire tasks so they aren't GC'd mid-run
+_background_tasks: set[asyncio.Task[None]] = set()
+# Past this many pending post-fire tasks, new ones run inline (backpressure)
+MAX_BACKGROUND_TASKS = 100
+
+# Signal checks one org may have in flight at once (each holds a pool connection)
+MAX_CONCURRENT_CHECKS_PER_ORG = 4
+
 
 # ============================================================================
 # Main Evaluation Loop
 # ============================================================================
 
 
-async def evaluate_signals_for_org(org_id: UUID) -> int:
+async def evaluate_signals_for_org(
+    org_id: UUID,
+    signals: list[Signal] | None = None,
+    shared_check_limit: asyncio.Semaphore | None = None,
+) -> int:
     """Evaluate all active signals for an organization.
 
+    Args:
+        org_id: Organization to evaluate
+        signals: The org's active signals when already loaded (e.g. by the
+            signal processor's grouped query); fetched here when omitted
+        shared_check_limit: Caps checks in flight across every org being
+            evaluated at the same time (the signal processor's sweep)
+
     Returns:
         Number of signals that fired
     """
     pool = await get_pool()
 
-    # Set RLS context
-    async with pool.acquire() as conn:
-        await conn.execute(f"SET LOCAL app.current_org_id = '{org_id}'")
-
+    if signals is None:
         signals = await get_active_signals(pool, org_id)
-        fired_count = 0
+    fired_count = 0
+    # Post-fire tasks spawned for this org only; other orgs' are not awaited here
+    post_fire_tasks: list[asyncio.Task[None]] = []
+
+    # Checks are independent reads that each borrow their own pool connection
+    # (every query filters on org_id explicitly). Run them concurrently, but
+    # never more than MAX_CONCURRENT_CHECKS_PER_ORG at once so one org with
+    # many signals can't take the whole pool.
+    check_limit = asyncio.Semaphore(MAX_CONCURRENT_CHECKS_PER_ORG)
+
+    async def run_check(signal: Signal) -> dict[str, Any] | None:
+        async with check_limit:
+            if shared_check_limit is None:
+                return await evaluate_signal(pool, signal, org_id)
+            async with shared_check_limit:
+                return await evaluate_signal(pool, signal, org_id)
+
+    results = await asyncio.gather(
+        *(run_check(signal) for signal in signals),
+        return_exceptions=True,
+    )
+
+    for signal, matched_data in zip(signals, results, strict=True):
+        try:
+            if isinstance(matched_data, BaseException):
+                raise matched_data
+            if matched_data:
+                task = await execute_signal_action(pool, signal, matched_data)
+                if task is not None:
+                    post_fire_tasks.append(task)
+                fired_count += 1
+        except Exception as e:
+            log.error(
+                "signal_evaluation_error",
+                signal_id=str(signal.id),
+                org_id=str(org_id),
+                error=str(e),
+            )
+
+    # Don't report the org as done while its fire records are still unwritten
+    if post_fire_tasks:
+        await asyncio.gather(*post_fire_tasks, return_exceptions=True)
+    return fired_count
 
-        for signal in signals:
-            try:
-                matched_data = await evaluate_signal(pool, signal, org_id)
-                if matched_data:
-                    await execute_signal_action(pool, signal, matched_data)
-                    fired_count += 1
-            except Exception as e:
-                log.error(
-                    "signal_evaluation_error",
-                    signal_id=str(signal.id),
-                    org_id=str(org_id),
-                    error=str(e),
-                )
 
-        return fired_count
+async def drain_background_tasks() -> None:
+    """Wait until no post-fire tasks (execution log, fire stats, pub/sub) are pending."""
+    # gather() snapshots the set, so loop to catch tasks added while draining. Finished
+    # tasks can linger until their discard callback runs, and gathering only those never
+    # yields, so wait on the pending ones
+    while pending := [task for task in _background_tasks if not task.done()]:
+        await asyncio.gather(*pending, return_exceptions=True)
 
 
 async def evaluate_signal(pool: Pool, signal: Signal, org_id: UUID) -> dict[str, Any] | None:
@@ -90,6 +143,51 @@ async def evaluate_signal(pool: Pool, signal: Signal, org_id: UUID) -> dict[str,
 # Signal Type Evaluators
 # ============================================================================
 
+# Module-level constants so every call sends identical SQL text and hits
+# asyncpg's per-connection prepared-statement cache instead of re-planning.
+# Match queries project only the columns notification payloads carry.
+_MATCH_COLUMNS = "id, domain, data_type, url, title, metadata, scraped_at"
+
+_JOB_CHANGE_SQL = f"""
+    SELECT {_MATCH_COLUMNS} FROM scraped_data
+    WHERE org_id = $1
+    AND data_type = 'contact'
+    AND job_title ILIKE $2
+    AND scraped_at > NOW() - INTERVAL '24 hours'
+    ORDER BY scraped_at DESC
+    LIMIT 100
+"""
+
+_FUNDING_SQL = f"""
+    SELECT {_MATCH_COLUMNS} FROM scraped_data
+    WHERE org_id = $1
+    AND (
+        metadata->>'type' = 'funding'
+        OR metadata->>'category' = 'funding'
+    )
+    AND scraped_at > NOW() - INTERVAL '7 days'
+    LIMIT 50
+"""
+
+_TECH_STACK_SQL = f"""
+    SELECT {_MATCH_COLUMNS} FROM scraped_data
+    WHERE org_id = $1
+    AND data_type = 'tech_stack'
+    AND tech_text ILIKE $2
+    AND scraped_at > NOW() - INTERVAL '7 days'
+    LIMIT 50
+"""
+
+_HIRING_SPIKE_SQL = """
+    SELECT domain, COUNT(*) as job_count
+    FROM scraped_data
+    WHERE org_id = $1
+    AND data_type = 'job_posting'
+    AND scraped_at > NOW() - INTERVAL '7 days'
+    GROUP BY domain
+    HAVING COUNT(*) >= $2
+"""
+
 
 async def check_job_change_signal(
     pool: Pool, signal: Signal, org_id: UUID
@@ -99,25 +197,14 @@ async def check_job_change_signal(
     job_title = filters.get("job_title_contains", "")
 
     # Query scraped data for recent job changes (last 24 hours)
-    query = """
-        SELECT * FROM scraped_data
-        WHERE org_id = $1
-        AND data_type = 'contact'
-        AND metadata->>'job_title' ILIKE $2
-        AND scraped_at > NOW() - INTERVAL '24 hours'
-        ORDER BY scraped_at DESC
-        LIMIT 100
-    """
-
-    rows = await pool.fetch(query, org_id, f"%{job_title}%")
+    rows = await pool.fetch(_JOB_CHANGE_SQL, org_id, f"%{job_title}%")
 
     if rows:
-        matches = [dict(row) for row in rows]
         return {
-            "matches": matches,
-            "match_count": len(matches),
+            "matches": rows,
+            "match_count": len(rows),
             "signal_type": "job_change",
-            "trigger": f"Found {len(matches)} contacts with job title containing '{job_title}'",
+            "trigger": f"Found {len(rows)} contacts with job title containing '{job_title}'",
         }
 
     return None
@@ -129,26 +216,14 @@ async def check_funding_signal(pool: Pool, signal: Signal, org_id: UUID) -> dict
 
     # In a real implementation, this would query funding data sources
     # For now, check scraped_data for funding mentions
-    query = """
-        SELECT * FROM scraped_data
-        WHERE org_id = $1
-        AND (
-            metadata->>'type' = 'funding'
-            OR metadata->>'category' = 'funding'
-        )
-        AND scraped_at > NOW() - INTERVAL '7 days'
-        LIMIT 50
-    """
-
-    rows = await pool.fetch(query, org_id)
+    rows = await pool.fetch(_FUNDING_SQL, org_id)
 
     if rows:
-        matches = [dict(row) for row in rows]
         return {
-            "matches": matches,
-            "match_count": len(matches),
+            "matches": rows,
+            "match_count": len(rows),
             "signal_type": "funding_round",
-            "trigger": f"Found {len(matches)} funding announcements",
+            "trigger": f"Found {len(rows)} funding announcements",
         }
 
     return None
@@ -162,27 +237,15 @@ async def check_tech_stack_signal(
     technology = filters.get("technology", "")
 
     # Query scraped data for tech stack changes
-    query = """
-        SELECT * FROM scraped_data
-        WHERE org_id = $1
-        AND data_type = 'tech_stack'
-        AND (
-            metadata->>'platform' ILIKE $2
-            OR metadata->>'technology' ILIKE $2
-        )
-        AND scraped_at > NOW() - INTERVAL '7 days'
-        LIMIT 50
-    """
-
-    rows = await pool.fetch(query, org_id, f"%{technology}%")
+    # Substring match: "react" also matches "react-dom" and "ReactJS"
+    rows = await pool.fetch(_TECH_STACK_SQL, org_id, f"%{technology}%")
 
     if rows:
-        matches = [dict(row) for row in rows]
         return {
-            "matches": matches,
-            "match_count": len(matches),
+            "matches": rows,
+            "match_count": len(rows),
             "signal_type": "tech_stack_change",
-            "trigger": f"Found {len(matches)} companies using {technology}",
+            "trigger": f"Found {len(rows)} companies using {technology}",
         }
 
     return None
@@ -197,25 +260,14 @@ async def check_hiring_spike_signal(
     spike_threshold = filters.get("spike_threshold", 3)  # 3x normal
 
     # Query for recent job postings
-    query = """
-        SELECT domain, COUNT(*) as job_count
-        FROM scraped_data
-        WHERE org_id = $1
-        AND data_type = 'job_posting'
-        AND scraped_at > NOW() - INTERVAL '7 days'
-        GROUP BY domain
-        HAVING COUNT(*) >= $2
-    """
-
-    rows = await pool.fetch(query, org_id, spike_threshold * 2)  # Simplified threshold
+    rows = await pool.fetch(_HIRING_SPIKE_SQL, org_id, spike_threshold * 2)  # Simplified threshold
 
     if rows:
-        matches = [dict(row) for row in rows]
         return {
-            "matches": matches,
-            "match_count": len(matches),
+            "matches": rows,
+            "match_count": len(rows),
             "signal_type": "hiring_spike",
-            "trigger": f"Found {len(matches)} companies with hiring spikes",
+            "trigger": f"Found {len(rows)} companies with hiring spikes",
         }
 
     return None
@@ -226,8 +278,15 @@ async def check_hiring_spike_signal(
 # ============================================================================
 
 
-async def execute_signal_action(pool: Pool, signal: Signal, matched_data: dict[str, Any]) -> None:
-    """Execute the configured action when a signal fires."""
+async def execute_signal_action(
+    pool: Pool, signal: Signal, matched_data: dict[str, Any]
+) -> asyncio.Task[None] | None:
+    """Execute the configured action when a signal fires.
+
+    Returns:
+        The background task recording the fire, or None if nothing is left
+        pending (recorded inline, or the action failed)
+    """
     action_config = signal.action_config
     action_type = action_config.get("type")
 
@@ -252,21 +311,6 @@ async def execute_signal_action(pool: Pool, signal: Signal, matched_data: dict[s
             response = None
             error_msg = f"Unknown action type: {action_type}"
 
-        # Log execution
-        await create_signal_execution(
-            pool,
-            signal_id=signal.id,
-            org_id=signal.org_id,
-            trigger_data=matched_data,
-            action_type=action_type,
-            action_status=status,
-            action_response=response,
-            error_message=error_msg,
-        )
-
-        # Update signal stats
-        await increment_signal_fire_count(pool, signal.id)
-
         log.info(
             "signal_fired",
             signal_id=str(signal.id),
@@ -275,8 +319,15 @@ async def execute_signal_action(pool: Pool, signal: Signal, matched_data: dict[s
             match_count=matched_data.get("match_count", 0),
         )
 
-        # Publish to Redis pub/sub for real-time streaming (Phase G)
-        await publish_signal_event(signal, matched_data)
+        # Execution log, signal stats and pub/sub are off the notification path
+        post_fire = _post_fire(pool, signal, matched_data, action_type, status, response, error_msg)
+        if len(_background_tasks) >= MAX_BACKGROUND_TASKS:
+            await post_fire
+            return None
+        task = asyncio.create_task(post_fire)
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return task
 
     except Exception as e:
         log.error(
@@ -297,6 +348,35 @@ async def execute_signal_action(pool: Pool, signal: Signal, matched_data: dict[s
             action_response=None,
             error_message=str(e),
         )
+        return None
+
+
+async def _post_fire(
+    pool: Pool,
+    signal: Signal,
+    matched_data: dict[str, Any],
+    action_type: str,
+    status: str,
+    response: dict[str, Any] | None,
+    error_msg: str | None,
+) -> None:
+    """Record a fired signal and publish it, after the action has been sent."""
+    try:
+        await record_signal_fire(
+            pool,
+            signal_id=signal.id,
+            org_id=signal.org_id,
+            trigger_data=matched_data,
+            action_type=action_type,
+            action_status=status,
+            action_response=response,
+            error_message=error_msg,
+        )
+    except Exception as e:
+        log.error("signal_execution_log_error", signal_id=str(signal.id), error=str(e))
+
+    # Publish to Redis pub/sub for real-time streaming (Phase G)
+    await publish_signal_event(signal, matched_data)
 
 
 async def send_slack_notification(
@@ -351,7 +431,12 @@ async def send_webhook_notification(
     }
 
     async with httpx.AsyncClient() as client:
-        response = await client.post(webhook_url, json=payload, timeout=10.0)
+        response = await client.post(
+            webhook_url,
+            content=json.dumps(payload, default=json_default),
+            headers={"Content-Type": "application/json"},
+            timeout=10.0,
+        )
         response.raise_for_status()
         return {"status_code": response.status_code, "response": response.text}
 
@@ -443,7 +528,7 @@ async def publish_signal_event(signal: Signal, matched_data: dict[str, Any]) ->
 
         # Publish to org-specific channel
         channel = f"intent:org:{signal.org_id}"
-        await redis_client.publish(channel, json.dumps(event))
+        await redis_client.publish(channel, json.dumps(event, default=json_default))
 
         await redis_client.aclose()
 
@@ -1,9 +1,26 @@
+import re
 from abc import ABC, abstractmethod
-from urllib.parse import urljoin
+from functools import cached_property, lru_cache
+from urllib.parse import urljoin, urlsplit
+
+from selectolax.lexbor import LexborHTMLParser
 
 from src.models.template import TemplateConfig
 
 
+# Hrefs the resolve_url fast paths can't copy verbatim: control chars, dot
+# segments, an empty host, and an empty query, fragment or params (all of
+# which urljoin rewrites or drops)
+_URLJOIN_ONLY_RE = re.compile(r"[\t\n\r]|/\.|^(?:https?:)?//(?:[/?#]|$)|[?#;](?:[?#;]|$)")
+
+
+@lru_cache(maxsize=64)
+def _split_base(base: str) -> tuple[str, str]:
+    # (scheme, "scheme://netloc") of a page URL; links on one page share a base.
+    parts = urlsplit(base)
+    return parts.scheme, f"{parts.scheme}://{parts.netloc}"
+
+
 class BaseTemplate(ABC):
     @property
     @abstractmethod
@@ -21,7 +38,70 @@ class BaseTemplate(ABC):
     @abstractmethod
     def extract_contacts(self, html: str, url: str) -> list[dict]: ...
 
+    @cached_property
+    def _signal_pattern(self) -> re.Pattern[str] | None:
+        signals = self.config.platform_signals
+        if not signals:
+            return None
+        return re.compile("|".join(re.escape(s) for s in signals), re.IGNORECASE)
+
+    def match_signals(self, html: str) -> bool:
+        """True if any platform signal occurs in the HTML (case-insensitive).
+
+        Scans the original string once instead of allocating html.lower()
+        and running one substring search per signal.
+        """
+        pattern = self._signal_pattern
+        return pattern is not None and pattern.search(html) is not None
+
+    def parse(self, html: str) -> LexborHTMLParser:
+        """Parse HTML into a selectolax tree.
+
+        Extract methods parse once and pass the tree to their helpers; the tree
+        lives only as long as that call.
+        """
+        return LexborHTMLParser(html)
+
+    def collect_links(
+        self, tree: LexborHTMLParser, selectors: list[str], base_url: str
+    ) -> list[str]:
+        """Resolved, de-duplicated hrefs of nodes matching any selector, in document order."""
+        if not selectors:
+            return []
+        seen_hrefs: set[str] = set()
+        seen: dict[str, None] = {}
+        for node in tree.css(", ".join(selectors)):
+            href = node.attributes.get("href")
+            if href and href not in seen_hrefs:
+                seen_hrefs.add(href)
+                url = self.resolve_url(href, base_url)
+                if url not in seen:
+                    seen[url] = None
+        return list(seen)
+
+    def first_text(self, tree: LexborHTMLParser, selectors: list[str]) -> str | None:
+        """Cleaned text of the first selector, in priority order, whose node has text."""
+        for selector in selectors:
+            node = tree.css_first(selector)
+            if node is not None:
+                text = node.text()
+                if text:
+                    return self.clean_text(text)
+        return None
+
     def resolve_url(self, relative: str, base: str) -> str:
+        # Fast paths for absolute, protocol-relative and root-relative hrefs.
+        # Anything urljoin would rewrite goes to urljoin: dot segments, control
+        # chars, and empty query/fragment/params ("/a?", "/a#", "/a;") it drops.
+        if _URLJOIN_ONLY_RE.search(relative) is None:
+            if relative.startswith(("http://", "https://")):
+                return relative
+            if relative.startswith("/"):
+                scheme, origin = _split_base(base)
+                if scheme in ("http", "https"):
+                    if relative.startswith("//"):
+                        return f"{scheme}:{relative}"
+                    return origin + relative
         return urljoin(base, relative)
 
     def clean_text(self, text: str) -> str:
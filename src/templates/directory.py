@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from src.models.template import PaginationStrategy, SelectorSet, TemplateConfig
 from src.templates.base import BaseTemplate
 
@@ -5,7 +7,7 @@ from src.templates.base import BaseTemplate
 class DirectoryTemplate(BaseTemplate):
     """Template for directory/listing style pages."""
 
-    @property
+    @cached_property
     def config(self) -> TemplateConfig:
         return TemplateConfig(
             id="directory",
@@ -1,3 +1,5 @@
+import re
+
 from src.models.template import TemplateConfig
 from src.templates.base import BaseTemplate
 from src.templates.directory import DirectoryTemplate
@@ -17,14 +19,31 @@ _TEMPLATES: list[BaseTemplate] = [
 
 _TEMPLATE_MAP: dict[str, BaseTemplate] = {t.config.id: t for t in _TEMPLATES}
 
+# Every platform signal of every template, compiled into one alternation so a
+# single pass over the HTML finds all of them. Each signal maps to the
+# detection priority (index in _TEMPLATES) of the template that owns it.
+_SIGNAL_PRIORITY: dict[str, int] = {}
+for _priority, _template in enumerate(_TEMPLATES):
+    for _signal in _template.config.platform_signals:
+        _SIGNAL_PRIORITY.setdefault(_signal.lower(), _priority)
+
+_SIGNAL_RE = re.compile(
+    "|".join(re.escape(s) for s in sorted(_SIGNAL_PRIORITY, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
 
 def detect_template(html: str, url: str) -> BaseTemplate:
     """Auto-detect which template matches the given HTML."""
-    for template in _TEMPLATES:
-        if template.config.id == "generic":
-            continue  # Skip generic during detection
-        if template.detect_platform(html, url):
-            return template
+    best: int | None = None
+    for match in _SIGNAL_RE.finditer(html):
+        priority = _SIGNAL_PRIORITY[match.group().lower()]
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break  # Highest-priority template — nothing can beat it
+    if best is not None:
+        return _TEMPLATES[best]
     return _TEMPLATE_MAP["generic"]
 
 
@@ -1,9 +1,11 @@
+from functools import cached_property
+
 from src.models.template import PaginationStrategy, SelectorSet, TemplateConfig
 from src.templates.base import BaseTemplate
 
 
 class WordPressTemplate(BaseTemplate):
-    @property
+    @cached_property
     def config(self) -> TemplateConfig:
         return TemplateConfig(
             id="wordpress",
@@ -96,42 +98,26 @@ class WordPressTemplate(BaseTemplate):
         )
 
     def detect_platform(self, html: str, url: str) -> bool:
-        html_lower = html.lower()
-        return any(signal in html_lower for signal in self.config.platform_signals)
+        return self.match_signals(html)
 
     def extract_blog_urls(self, html: str, base_url: str) -> list[str]:
-        from selectolax.parser import HTMLParser
-
-        tree = HTMLParser(html)
-        urls: list[str] = []
-
-        for selector in self.config.selectors.article_link:
-            for node in tree.css(selector):
-                href = node.attributes.get("href")
-                if href:
-                    urls.append(self.resolve_url(href, base_url))
-
-        return list(dict.fromkeys(urls))  # deduplicate, preserve order
+        tree = self.parse(html)
+        return self.collect_links(tree, self.config.selectors.article_link, base_url)
 
     def extract_article(self, html: str, url: str) -> dict:
-        from selectolax.parser import HTMLParser
-
-        tree = HTMLParser(html)
+        tree = self.parse(html)
+        selectors = self.config.selectors
         result: dict = {"url": url}
 
-        for selector in self.config.selectors.article_title:
-            node = tree.css_first(selector)
-            if node and node.text():
-                result["title"] = self.clean_text(node.text())
-                break
+        title = self.first_text(tree, selectors.article_title)
+        if title:
+            result["title"] = title
 
-        for selector in self.config.selectors.article_author:
-            node = tree.css_first(selector)
-            if node and node.text():
-                result["author"] = self.clean_text(node.text())
-                break
+        author = self.first_text(tree, selectors.article_author)
+        if author:
+            result["author"] = author
 
-        for selector in self.config.selectors.article_date:
+        for selector in selectors.article_date:
             node = tree.css_first(selector)
             if node:
                 result["date"] = node.attributes.get("datetime") or self.clean_text(
@@ -139,13 +125,10 @@ class WordPressTemplate(BaseTemplate):
                 )
                 break
 
-        for selector in self.config.selectors.article_content:
-            node = tree.css_first(selector)
-            if node and node.text():
-                text = self.clean_text(node.text())
-                result["word_count"] = len(text.split())
-                result["excerpt"] = text[:300]
-                break
+        text = self.first_text(tree, selectors.article_content)
+        if text:
+            result["word_count"] = len(text.split())
+            result["excerpt"] = text[:300]
 
         return result
 
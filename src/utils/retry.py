@@ -1,4 +1,5 @@
 import asyncio
+import random
 from collections.abc import Callable, Coroutine
 from typing import Any
 
@@ -16,7 +17,11 @@ async def retry_async[T](
     retry_on: tuple[type[Exception], ...] = (Exception,),
     **kwargs: Any,
 ) -> T:
-    """Retry an async function with exponential backoff."""
+    """Retry an async function with exponential backoff.
+
+    Each delay is jittered down to 50-100% of the capped backoff so that many
+    callers failing together do not retry in lockstep.
+    """
     last_error: Exception | None = None
 
     for attempt in range(max_retries + 1):
@@ -26,7 +31,7 @@ async def retry_async[T](
             last_error = e
             if attempt == max_retries:
                 break
-            delay = min(base_delay * (2**attempt), max_delay)
+            delay = min(base_delay * (1 << attempt), max_delay) * (0.5 + random.random() * 0.5)
             log.warning(
                 "retry_attempt",
                 attempt=attempt + 1,
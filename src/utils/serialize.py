@@ -0,0 +1,13 @@
+from datetime import date, datetime
+from typing import Any
+
+from asyncpg import Record
+
+
+def json_default(obj: Any) -> Any:
+    """`default=` hook for json.dumps covering asyncpg rows and their column types."""
+    if isinstance(obj, Record):
+        return dict(obj)
+    if isinstance(obj, datetime | date):
+        return obj.isoformat()
+    return str(obj)  # UUID, Decimal, ...
@@ -4,13 +4,38 @@ import structlog
 
 log = structlog.get_logger()
 
+# Pipe read size when draining subprocess output
+_CHUNK_BYTES = 64 * 1024
+
+
+async def _drain(stream: asyncio.StreamReader, limit: int | None) -> bytes:
+    """Read a pipe to EOF, keeping at most ``limit`` bytes.
+
+    The pipe is always drained fully so the child never blocks on a full buffer.
+    """
+    buf = bytearray()
+    while True:
+        chunk = await stream.read(_CHUNK_BYTES)
+        if not chunk:
+            break
+        if limit is None:
+            buf += chunk
+        elif len(buf) < limit:
+            buf += chunk[: limit - len(buf)]
+    return bytes(buf)
+
 
 async def run_command(
     *args: str,
     timeout: int = 60,
     cwd: str | None = None,
+    max_output_bytes: int | None = None,
 ) -> tuple[str, str, int]:
-    """Run a shell command asynchronously and return (stdout, stderr, returncode)."""
+    """Run a shell command asynchronously and return (stdout, stderr, returncode).
+
+    stdout and stderr are streamed in chunks; pass ``max_output_bytes`` to cap
+    how much of each is kept in memory for verbose commands.
+    """
     log.debug("shell_exec", command=args)
 
     proc = await asyncio.create_subprocess_exec(
@@ -19,23 +44,31 @@ async def run_command(
         stderr=asyncio.subprocess.PIPE,
         cwd=cwd,
     )
+    assert proc.stdout is not None and proc.stderr is not None
 
     try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        stdout_bytes, stderr_bytes, _ = await asyncio.wait_for(
+            asyncio.gather(
+                _drain(proc.stdout, max_output_bytes),
+                _drain(proc.stderr, max_output_bytes),
+                proc.wait(),
+            ),
+            timeout=timeout,
+        )
     except TimeoutError:
         proc.kill()
-        await proc.communicate()
+        await proc.wait()
         raise TimeoutError(f"Command timed out after {timeout}s: {' '.join(args)}")
 
     stdout = stdout_bytes.decode("utf-8", errors="replace")
-    stderr = stderr_bytes.decode("utf-8", errors="replace")
 
     if proc.returncode != 0:
         log.warning(
             "shell_error",
             command=args,
             returncode=proc.returncode,
-            stderr=stderr[:500],
+            stderr=stderr_bytes[:500].decode("utf-8", errors="replace"),
         )
 
+    stderr = stderr_bytes.decode("utf-8", errors="replace")
     return stdout, stderr, proc.returncode or 0
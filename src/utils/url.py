@@ -1,8 +1,33 @@
+import re
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse, urlunparse
 
+_NORMAL_URL_RE = re.compile(r"(https?://[a-z0-9.\-]+(?::\d+)?)(/[^?#;\s]*)?(\?[^#\s]+)?\Z")
 
+_NON_PAGE_PREFIXES = ("#", "mailto:", "tel:", "javascript:")
+
+# Common non-HTML extensions
+_SKIP_EXTENSIONS = (
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".ico",
+    ".css", ".js", ".woff", ".woff2", ".ttf", ".eot",
+    ".mp3", ".mp4", ".avi", ".mov",
+    ".zip", ".gz", ".tar",
+    ".xml", ".rss", ".atom",
+)
+
+
+# URLs of one domain repeat across mapping, validation and classification;
+# both helpers are pure, so repeats are served from a bounded cache.
+@lru_cache(maxsize=4096)
 def normalize_url(url: str, base_url: str | None = None) -> str:
     """Normalize a URL: resolve relative, strip fragments, lowercase scheme/host."""
+    # Fast path: absolute URL whose scheme/host are already lowercase, with no
+    # fragment, params or userinfo — only the trailing-slash rule can apply.
+    match = _NORMAL_URL_RE.match(url)
+    if match:
+        origin, path, query = match.groups("")
+        return origin + (path.rstrip("/") or "/") + query
+
     if base_url and not url.startswith(("http://", "https://")):
         url = urljoin(base_url, url)
 
@@ -19,6 +44,7 @@ def normalize_url(url: str, base_url: str | None = None) -> str:
     return urlunparse(normalized)
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """Extract the domain (netloc) from a URL."""
     parsed = urlparse(url)
@@ -38,35 +64,8 @@ def ensure_scheme(url: str, default_scheme: str = "https") -> str:
 
 def is_valid_scrape_url(url: str) -> bool:
     """Check if a URL is worth scraping (not a file, mailto, anchor, etc.)."""
-    if not url or url.startswith(("#", "mailto:", "tel:", "javascript:")):
+    if not url or url.startswith(_NON_PAGE_PREFIXES):
         return False
 
     parsed = urlparse(url)
-    # Skip common non-HTML extensions
-    skip_extensions = {
-        ".pdf",
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".svg",
-        ".ico",
-        ".css",
-        ".js",
-        ".woff",
-        ".woff2",
-        ".ttf",
-        ".eot",
-        ".mp3",
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".zip",
-        ".gz",
-        ".tar",
-        ".xml",
-        ".rss",
-        ".atom",
-    }
-    path_lower = parsed.path.lower()
-    return not any(path_lower.endswith(ext) for ext in skip_extensions)
+    return not parsed.path.lower().endswith(_SKIP_EXTENSIONS)
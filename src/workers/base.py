@@ -1,12 +1,16 @@
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
 
 import httpx
 import structlog
 
+from src.db.pool import get_pool
+from src.db.queries.jobs import update_heartbeat
+from src.db.queries.scraped_data import batch_insert_scraped_data
 from src.models.scraped_data import ScrapedData
 from src.models.scraping import FetchOptions, FetchResult, ScrapingTier
 from src.models.template import TemplateConfig
@@ -39,6 +43,8 @@ class BaseWorker(ABC):
     ):
         self.domain = domain
         self.job_id = job_id
+        # Parsed once: every record and heartbeat needs the UUID form
+        self._job_uuid = UUID(job_id)
         self.template = template
         self._pool = pool
         self.org_id = org_id
@@ -50,8 +56,15 @@ class BaseWorker(ABC):
         self.log = structlog.get_logger().bind(
             worker=self.__class__.__name__, domain=domain, job_id=job_id
         )
-        self._rate_limiter = RateLimiter()
+        # Honor the template's per-request spacing when a template is set;
+        # otherwise no baseline delay (adaptive backoff only)
+        self._rate_limiter = RateLimiter(
+            default_delay_ms=template.rate_limit_ms if template else 0,
+        )
         self._last_heartbeat: float = 0.0
+        # One fetcher per tier for the worker's lifetime, so per-fetcher
+        # clients (e.g. the Redis session store) are reused across pages
+        self._fetchers: dict[ScrapingTier, Any] = {}
 
         if pool is not None:
             from src.services.escalation import EscalationService
@@ -74,15 +87,34 @@ class BaseWorker(ABC):
         if self._pool is None:
             return
         try:
-            from src.db.queries.jobs import update_heartbeat
-
-            await update_heartbeat(self._pool, UUID(self.job_id))
+            await update_heartbeat(self._pool, self._job_uuid)
         except Exception as e:
             self.log.warning("heartbeat_failed", error=str(e))
 
     @abstractmethod
     async def execute(self, urls: list[str]) -> list[ScrapedData]: ...
 
+    def _get_fetcher(self, tier: ScrapingTier) -> Any:
+        # Synchronous, so concurrent page tasks can't interleave here; the
+        # fetchers lock their own lazily created clients
+        fetcher = self._fetchers.get(tier)
+        if fetcher is None:
+            fetcher = self._fetchers[tier] = create_fetcher(tier)
+        return fetcher
+
+    async def close(self) -> None:
+        """Release clients held by this worker's fetchers."""
+        fetchers = list(self._fetchers.values())
+        self._fetchers.clear()
+        for fetcher in fetchers:
+            close = getattr(fetcher, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                self.log.warning("fetcher_close_failed", error=str(e))
+
     async def fetch_page(self, url: str, options: FetchOptions | None = None) -> FetchResult:
         """Fetch a page with automatic tier escalation, rate limiting, and cost tracking.
 
@@ -103,7 +135,7 @@ class BaseWorker(ABC):
         # If tier override is set, use it directly (no escalation)
         if self._tier_override:
             await self._rate_limiter.wait(domain)
-            fetcher = create_fetcher(self._tier_override)
+            fetcher = self._get_fetcher(self._tier_override)
             result = await retry_async(
                 fetcher.fetch,
                 url,
@@ -123,7 +155,7 @@ class BaseWorker(ABC):
 
         if self._escalation is None:
             await self._rate_limiter.wait(domain)
-            fetcher = create_fetcher(ScrapingTier.PLAYWRIGHT)
+            fetcher = self._get_fetcher(ScrapingTier.PLAYWRIGHT)
             result = await retry_async(
                 fetcher.fetch,
                 url,
@@ -140,7 +172,7 @@ class BaseWorker(ABC):
 
         while True:
             await self._rate_limiter.wait(domain)
-            fetcher = create_fetcher(current_tier)
+            fetcher = self._get_fetcher(current_tier)
             result = await retry_async(
                 fetcher.fetch,
                 url,
@@ -192,9 +224,6 @@ class BaseWorker(ABC):
             current_tier = next_tier
 
     async def export_results(self, data: list[dict]) -> int:
-        from src.db.pool import get_pool
-        from src.db.queries.scraped_data import batch_insert_scraped_data
-
         # Inject org_id and user_id into each record if the worker has them
         if self.org_id:
             org_uuid = UUID(self.org_id) if isinstance(self.org_id, str) else self.org_id
@@ -7,12 +7,15 @@ TechDetector, ResourceFinder, PricingFinder) with a single pass that:
 3. Runs specialized extractors based on URL classification
 """
 
+import asyncio
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 from uuid import UUID
 
 import structlog
 
+from src.config.settings import get_settings
+from src.db.queries.jobs import is_job_cancelled, update_heartbeat
 from src.models.scraped_data import (
     ArticleMetadata,
     BlogUrlMetadata,
@@ -37,6 +40,12 @@ log = structlog.get_logger()
 # Minimum word count to treat a page as having article-worthy content
 MIN_ARTICLE_WORDS = 200
 
+# Pages fetched in parallel when the worker has no template config
+_DEFAULT_CONCURRENCY = 5
+
+# Records buffered before one batched insert into scraped_data
+_EXPORT_BATCH_SIZE = 100
+
 _SKIP_EXTENSIONS = frozenset({
     ".doc", ".docx", ".zip", ".png", ".jpg", ".jpeg",
     ".gif", ".svg", ".webp", ".mp3", ".mp4", ".avi",
@@ -45,10 +54,27 @@ _SKIP_EXTENSIONS = frozenset({
 
 _ERROR_MARKERS = ("error", "404", "not found", "page not found")
 
+# Article links on blog landing pages, across common CMS themes
+_BLOG_ARTICLE_LINK_SELECTORS = [
+    "article a", "h2 a", ".post-title a",
+    ".entry-title a", "a[rel='bookmark']",
+]
+
 
 class ContentWorker(BaseWorker):
     """Fetches each URL once and runs all applicable extractors."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reset_run_state()
+
+    def _reset_run_state(self) -> None:
+        self._cancelled = False
+        self._urls_processed = 0
+        # One timestamp for every record returned from a run
+        self._scraped_at = datetime.now(UTC)
+        self._pending_exports: list[dict] = []
+
     async def execute(  # type: ignore[override]
         self,
         classified_urls: list[dict],
@@ -64,7 +90,6 @@ class ContentWorker(BaseWorker):
             return []
 
         # Enforce max pages limit to prevent runaway jobs
-        from src.config.settings import get_settings
         max_pages = get_settings().max_scrape_pages_per_job
         if len(classified_urls) > max_pages:
             self.log.warning(
@@ -80,54 +105,42 @@ class ContentWorker(BaseWorker):
             data_types=data_types,
         )
 
-        all_results: list[ScrapedData] = []
+        self._reset_run_state()
+        try:
+            return await self._run_phases(classified_urls, data_types)
+        finally:
+            await self._flush_exports()
+            await self.close()
+
+    async def _run_phases(
+        self,
+        classified_urls: list[dict],
+        data_types: list[str],
+    ) -> list[ScrapedData]:
         fetched_urls: set[str] = set()
-        article_urls_from_blogs: list[str] = []
-        urls_processed = 0
 
         # --- Phase 1: Process all classified URLs ---
+        phase1: list[tuple[str, str]] = []
         for entry in classified_urls:
             url = entry["url"]
-            data_type = entry.get("data_type", DataType.PAGE)
-
-            if url in fetched_urls:
-                continue
-            fetched_urls.add(url)
-
-            # Cooperative cancellation check — run on EVERY URL so a user-cancel
-            # exits within one URL iteration instead of waiting up to 5.
-            if self._pool:
-                try:
-                    from src.db.queries.jobs import is_job_cancelled
-                    if await is_job_cancelled(self._pool, UUID(self.job_id)):
-                        self.log.info("job_cancelled_by_user", urls_processed=urls_processed)
-                        return all_results
-                except Exception as e:
-                    self.log.warning("cancel_check_failed", error=str(e))
-
-            try:
-                records = await self._process_url(url, data_type, data_types)
-
-                # Collect article URLs discovered from blog landing pages
-                for r in records:
-                    if r.data_type == DataType.BLOG_URL and isinstance(r.metadata, dict):
-                        discovered = r.metadata.get("article_urls", [])
-                        article_urls_from_blogs.extend(discovered)
-
-                all_results.extend(records)
-            except Exception as e:
-                self.log.error("process_url_error", url=url, error=str(e))
+            if url not in fetched_urls:
+                fetched_urls.add(url)
+                phase1.append((url, entry.get("data_type", DataType.PAGE)))
 
-            # Heartbeat every 5 URLs to signal the job is still active
-            urls_processed += 1
-            if urls_processed % 5 == 0 and self._pool:
-                try:
-                    from src.db.queries.jobs import update_heartbeat
-                    await update_heartbeat(self._pool, UUID(self.job_id))
-                except Exception as e:
-                    # Non-critical — don't fail job over heartbeat — but log
-                    # so stale-job recovery has an observable trail.
-                    self.log.warning("heartbeat_failed", error=str(e))
+        all_results: list[ScrapedData] = []
+        article_urls_from_blogs: list[str] = []
+        for records in await self._process_batch(
+            phase1, data_types, "process_url_error", "job_cancelled_by_user",
+        ):
+            # Collect article URLs discovered from blog landing pages
+            for r in records:
+                if r.data_type == DataType.BLOG_URL and isinstance(r.metadata, dict):
+                    discovered = r.metadata.get("article_urls", [])
+                    article_urls_from_blogs.extend(discovered)
+            all_results.extend(records)
+
+        if self._cancelled:
+            return all_results
 
         # --- Phase 2: Fetch article URLs discovered from blog landing pages ---
         if "article" in data_types and article_urls_from_blogs:
@@ -135,41 +148,118 @@ class ContentWorker(BaseWorker):
                 "processing_blog_articles",
                 count=len(article_urls_from_blogs),
             )
+            phase2: list[tuple[str, str]] = []
             for url in article_urls_from_blogs:
-                if url in fetched_urls:
-                    continue
-                fetched_urls.add(url)
+                if url not in fetched_urls:
+                    fetched_urls.add(url)
+                    phase2.append((url, DataType.ARTICLE))
 
-                # Cooperative cancellation check — Phase 2 must honor cancels too.
-                if self._pool:
-                    try:
-                        from src.db.queries.jobs import is_job_cancelled
-                        if await is_job_cancelled(self._pool, UUID(self.job_id)):
-                            self.log.info(
-                                "job_cancelled_by_user_phase2",
-                                urls_processed=urls_processed,
-                            )
-                            return all_results
-                    except Exception as e:
-                        self.log.warning("cancel_check_failed", error=str(e))
+            for records in await self._process_batch(
+                phase2, data_types, "article_process_error", "job_cancelled_by_user_phase2",
+            ):
+                all_results.extend(records)
+
+            if self._cancelled:
+                return all_results
+
+        self.log.info("content_worker_done", total_records=len(all_results))
+        return all_results
+
+    async def _process_batch(
+        self,
+        items: list[tuple[str, str]],
+        data_types: list[str],
+        error_event: str,
+        cancel_event: str,
+    ) -> list[list[ScrapedData]]:
+        """Process (url, data_type) pairs concurrently, bounded by the template.
+
+        Returns one record list per item, in input order. Failed and skipped
+        URLs contribute an empty list.
+        """
+        limit = self.template.max_concurrent_pages if self.template else _DEFAULT_CONCURRENCY
+        sem = asyncio.Semaphore(max(1, limit))
 
+        async def process_one(url: str, data_type: str) -> list[ScrapedData]:
+            async with sem:
+                if await self._check_cancelled(cancel_event):
+                    return []
+
+                records: list[ScrapedData] = []
                 try:
-                    records = await self._process_url(url, DataType.ARTICLE, data_types)
-                    all_results.extend(records)
+                    records = await self._process_url(url, data_type, data_types)
                 except Exception as e:
-                    self.log.error("article_process_error", url=url, error=str(e))
+                    self.log.error(error_event, url=url, error=str(e))
 
-                # Heartbeat every 5 URLs in phase 2 as well
-                urls_processed += 1
-                if urls_processed % 5 == 0 and self._pool:
+                # Heartbeat every 5 URLs to signal the job is still active
+                self._urls_processed += 1
+                if self._urls_processed % 5 == 0 and self._pool:
                     try:
-                        from src.db.queries.jobs import update_heartbeat
-                        await update_heartbeat(self._pool, UUID(self.job_id))
+                        await update_heartbeat(self._pool, self._job_uuid)
                     except Exception as e:
+                        # Non-critical — don't fail job over heartbeat — but log
+                        # so stale-job recovery has an observable trail.
                         self.log.warning("heartbeat_failed", error=str(e))
+                return records
 
-        self.log.info("content_worker_done", total_records=len(all_results))
-        return all_results
+        return await asyncio.gather(*(process_one(url, dt) for url, dt in items))
+
+    async def _queue_export(self, records: list[dict]) -> None:
+        """Buffer records and insert them once a full batch has accumulated."""
+        self._pending_exports.extend(records)
+        if len(self._pending_exports) >= _EXPORT_BATCH_SIZE:
+            await self._flush_exports()
+
+    async def _flush_exports(self) -> None:
+        # Swap before awaiting so concurrent pages keep queueing into a fresh list
+        batch, self._pending_exports = self._pending_exports, []
+        if not batch:
+            return
+        try:
+            await self.export_results(batch)
+        except Exception:
+            # export_results has already logged db_insert_failed with the error
+            self.log.warning("export_batch_dropped", record_count=len(batch))
+
+    def _to_scraped_data(self, records: list[dict], url: str) -> list[ScrapedData]:
+        """Wrap queued records as ScrapedData return values.
+
+        The records were built from already-validated metadata models, so
+        model_construct reuses each metadata dict instead of re-validating it.
+        """
+        return [
+            ScrapedData.model_construct(
+                id=UUID(int=0),
+                job_id=self._job_uuid,
+                domain=self.domain,
+                data_type=rec["data_type"],
+                url=rec.get("url", url),
+                title=rec.get("title"),
+                metadata=rec.get("metadata", {}),
+                scraped_at=self._scraped_at,
+            )
+            for rec in records
+        ]
+
+    async def _check_cancelled(self, event: str) -> bool:
+        """Cooperative cancellation check, run before EVERY URL.
+
+        A user-cancel stops new fetches immediately; pages already in flight
+        finish and their records are kept.
+        """
+        if self._cancelled:
+            return True
+        if not self._pool:
+            return False
+        try:
+            if await is_job_cancelled(self._pool, self._job_uuid):
+                if not self._cancelled:
+                    self._cancelled = True
+                    self.log.info(event, urls_processed=self._urls_processed)
+                return True
+        except Exception as e:
+            self.log.warning("cancel_check_failed", error=str(e))
+        return False
 
     # ------------------------------------------------------------------
     # Core: fetch once, extract everything
@@ -192,7 +282,9 @@ class ContentWorker(BaseWorker):
             return await self._process_pdf(url, fetch_result)
 
         html = fetch_result.html
-        if not html or len(html) < 100:
+        # Error and redirect stubs aren't worth a parse and extraction pass
+        if not html or len(html) < get_settings().min_content_html_bytes:
+            self.log.warning("tiny_html", url=url, size=len(html or ""))
             return []
 
         parser = HtmlParser(html, url)
@@ -204,39 +296,30 @@ class ContentWorker(BaseWorker):
             return []
 
         rich_meta = extract_rich_metadata(html, url)
+        content = parser.extract_content()
+        word_count = len(content.split()) if content else 0
         records: list[dict] = []
 
         # --- ALWAYS: full page content ---
-        records.append(self._extract_page_record(url, parser, rich_meta))
+        records.append(self._extract_page_record(url, title, content, word_count, rich_meta))
 
         # raw_only mode: save page content only, skip all specialized extraction
         if self.raw_only:
-            if records:
-                await self.export_results(records)
-            return [
-                ScrapedData(
-                    id=UUID(int=0),
-                    job_id=UUID(self.job_id),
-                    domain=self.domain,
-                    data_type=rec["data_type"],
-                    url=rec.get("url", url),
-                    title=rec.get("title"),
-                    metadata=rec.get("metadata", {}),
-                    scraped_at=datetime.now(UTC),
-                )
-                for rec in records
-            ]
+            await self._queue_export(records)
+            return self._to_scraped_data(records, url)
 
         # --- Specialized extraction based on URL classification ---
 
         if data_type == DataType.BLOG_URL and "blog_url" in data_types:
-            blog_rec, _ = self._extract_blog_landing(url, html, parser, rich_meta)
+            blog_rec, _ = self._extract_blog_landing(url, title, parser, rich_meta)
             if blog_rec:
                 records.append(blog_rec)
 
         # Article extraction for any page with substantial content
-        if "article" in data_types and parser.count_words() >= MIN_ARTICLE_WORDS:
-            article_rec = self._extract_article_record(url, parser, rich_meta)
+        if "article" in data_types and word_count >= MIN_ARTICLE_WORDS:
+            article_rec = self._extract_article_record(
+                url, title, content, word_count, parser, rich_meta,
+            )
             if article_rec:
                 records.append(article_rec)
 
@@ -259,50 +342,39 @@ class ContentWorker(BaseWorker):
                 if tech_rec:
                     records.append(tech_rec)
 
-        # Batch insert all records for this URL
-        if records:
-            await self.export_results(records)
+        # Queue for the next batched insert
+        await self._queue_export(records)
 
         # Convert to ScrapedData for return value
-        return [
-            ScrapedData(
-                id=UUID(int=0),
-                job_id=UUID(self.job_id),
-                domain=self.domain,
-                data_type=rec["data_type"],
-                url=rec.get("url", url),
-                title=rec.get("title"),
-                metadata=rec.get("metadata", {}),
-                scraped_at=datetime.now(UTC),
-            )
-            for rec in records
-        ]
+        return self._to_scraped_data(records, url)
 
     # ------------------------------------------------------------------
     # Extractors — ported 1:1 from existing workers
     # ------------------------------------------------------------------
 
     def _extract_page_record(
-        self, url: str, parser: HtmlParser, rich_meta: dict,
+        self, url: str, title: str | None, content: str | None, word_count: int, rich_meta: dict,
     ) -> dict:
         """Full page content record — saved for every successfully fetched page."""
-        content = parser.extract_content()
-        word_count = len(content.split()) if content else 0
         return {
-            "job_id": UUID(self.job_id),
+            "job_id": self._job_uuid,
             "domain": self.domain,
             "data_type": DataType.PAGE,
             "url": url,
-            "title": parser.extract_title(),
+            "title": title,
             "metadata": {**rich_meta, "content": content, "word_count": word_count},
         }
 
     def _extract_article_record(
-        self, url: str, parser: HtmlParser, rich_meta: dict,
+        self,
+        url: str,
+        title: str | None,
+        content: str | None,
+        word_count: int,
+        parser: HtmlParser,
+        rich_meta: dict,
     ) -> dict | None:
         """Article record for pages with substantial text. Ported from ArticleParserWorker."""
-        content = parser.extract_content()
-        word_count = parser.count_words()
         excerpt = parser.extract_meta("description")
 
         if word_count == 0 and excerpt is None:
@@ -316,23 +388,20 @@ class ContentWorker(BaseWorker):
             content=content,
         )
         return {
-            "job_id": UUID(self.job_id),
+            "job_id": self._job_uuid,
             "domain": self.domain,
             "data_type": DataType.ARTICLE,
             "url": url,
-            "title": parser.extract_title(),
+            "title": title,
             "metadata": {**rich_meta, **metadata.model_dump()},
         }
 
     def _extract_blog_landing(
-        self, url: str, html: str, parser: HtmlParser, rich_meta: dict,
+        self, url: str, title: str | None, parser: HtmlParser, rich_meta: dict,
     ) -> tuple[dict, list[str]]:
         """Blog landing page: extract article links. Ported from BlogExtractorWorker."""
         article_links = parser.extract_links(
-            selectors=[
-                "article a", "h2 a", ".post-title a",
-                ".entry-title a", "a[rel='bookmark']",
-            ],
+            selectors=_BLOG_ARTICLE_LINK_SELECTORS,
             base_url=url,
         )
         article_links = self._filter_article_links(article_links, url)
@@ -343,11 +412,11 @@ class ContentWorker(BaseWorker):
             total_articles=len(article_links),
         )
         record = {
-            "job_id": UUID(self.job_id),
+            "job_id": self._job_uuid,
             "domain": self.domain,
             "data_type": DataType.BLOG_URL,
             "url": url,
-            "title": parser.extract_title(),
+            "title": title,
             "metadata": {**rich_meta, **metadata.model_dump()},
         }
         return record, article_links
@@ -363,7 +432,7 @@ class ContentWorker(BaseWorker):
             meta = ContactMetadata(**person)
             name = f"{meta.first_name or ''} {meta.last_name or ''}".strip() or None
             records.append({
-                "job_id": UUID(self.job_id),
+                "job_id": self._job_uuid,
                 "domain": self.domain,
                 "data_type": DataType.CONTACT,
                 "url": url,
@@ -390,7 +459,7 @@ class ContentWorker(BaseWorker):
             frameworks=detected.get("frameworks", []),
         )
         return {
-            "job_id": UUID(self.job_id),
+            "job_id": self._job_uuid,
             "domain": self.domain,
             "data_type": DataType.TECH_STACK,
             "url": url,
@@ -408,7 +477,7 @@ class ContentWorker(BaseWorker):
         for resource in resources:
             meta = ResourceMetadata(**resource)
             records.append({
-                "job_id": UUID(self.job_id),
+                "job_id": self._job_uuid,
                 "domain": self.domain,
                 "data_type": DataType.RESOURCE,
                 "url": resource.get("url", url),
@@ -427,7 +496,7 @@ class ContentWorker(BaseWorker):
         for plan in plans:
             meta = PricingMetadata(**plan)
             records.append({
-                "job_id": UUID(self.job_id),
+                "job_id": self._job_uuid,
                 "domain": self.domain,
                 "data_type": DataType.PRICING,
                 "url": url,
@@ -488,7 +557,7 @@ class ContentWorker(BaseWorker):
         )
 
         record = {
-            "job_id": UUID(self.job_id),
+            "job_id": self._job_uuid,
             "domain": self.domain,
             "data_type": DataType.DOCUMENT,
             "url": url,
@@ -496,17 +565,5 @@ class ContentWorker(BaseWorker):
             "metadata": metadata.model_dump(),
         }
 
-        await self.export_results([record])
-
-        return [
-            ScrapedData(
-                id=UUID(int=0),
-                job_id=UUID(self.job_id),
-                domain=self.domain,
-                data_type=DataType.DOCUMENT,
-                url=url,
-                title=record["title"],
-                metadata=record["metadata"],
-                scraped_at=datetime.now(UTC),
-            )
-        ]
+        await self._queue_export([record])
+        return self._to_scraped_data([record], url)
@@ -1,5 +1,9 @@
+from collections import Counter
+from uuid import UUID
+
 import structlog
 
+from src.db.queries.jobs import update_heartbeat
 from src.scraping.parser.url_classifier import classify_urls
 from src.scraping.validator.url_validator import validate_and_deduplicate
 from src.services.crawler import CrawlerService
@@ -14,6 +18,7 @@ class DomainMapperWorker:
     def __init__(self, domain: str, job_id: str, org_id: str | None = None, pool=None):
         self.domain = domain
         self.job_id = job_id
+        self._job_uuid = UUID(job_id)
         self.org_id = org_id
         self.pool = pool
         self.crawler = CrawlerService(
@@ -26,9 +31,7 @@ class DomainMapperWorker:
         if self.pool is None:
             return
         try:
-            from uuid import UUID
-            from src.db.queries.jobs import update_heartbeat
-            await update_heartbeat(self.pool, UUID(self.job_id))
+            await update_heartbeat(self.pool, self._job_uuid)
         except Exception as e:
             self.log.warning("heartbeat_failed", error=str(e))
 
@@ -72,10 +75,7 @@ class DomainMapperWorker:
         self.log.info(
             "urls_classified",
             total=len(classified),
-            types={
-                dt: len([c for c in classified if c["data_type"] == dt])
-                for dt in set(c["data_type"] for c in classified)
-            },
+            types=dict(Counter(c["data_type"] for c in classified)),
         )
 
         return classified
@@ -1,61 +1,153 @@
-"""Signal processor worker - evaluates intent signals on a schedule.
+"""Signal processor worker - evaluates intent signals.
 
-This worker runs every 15 minutes and evaluates all active signals
-across all organizations.
+Signals are evaluated per org as soon as a scrape job for that org completes
+(evaluate_org_signals, enqueued by the scrape job). process_signals sweeps all
+organizations every 15 minutes for data that arrived any other way.
 """
 
+import asyncio
 from typing import Any
+from uuid import UUID
 
 import structlog
+from arq.connections import ArqRedis
 
+from src.config.settings import get_settings
 from src.db.pool import get_pool
-from src.db.queries.signals import get_all_orgs_with_active_signals
+from src.db.queries.signals import get_active_signals_grouped_by_org
+from src.models.signals import Signal
 from src.services.signal_evaluator import evaluate_signals_for_org
 
 log = structlog.get_logger()
 
+# Each org's evaluation runs its signal checks concurrently, so by default cap
+# the number of orgs in flight at a fraction of the pool to keep connections
+# available. settings.signal_org_concurrency overrides this.
+ORG_CONCURRENCY_DIVISOR = 5
+
+# Event-driven evaluations are deferred briefly and keyed per org, so a burst
+# of scrape jobs finishing for one org collapses into a single evaluation.
+SIGNAL_EVAL_DEBOUNCE_SECONDS = 30
+# Lifetime of the "data landed during a run" flag; the sweep covers anything older
+SIGNAL_EVAL_RERUN_FLAG_TTL_SECONDS = 3600
+
+
+def _org_concurrency(pool_max_size: int) -> int:
+    """Orgs to evaluate at once: the setting (or a pool fraction), below the pool size."""
+    concurrency = get_settings().signal_org_concurrency or pool_max_size // ORG_CONCURRENCY_DIVISOR
+    # Never let orgs alone claim every connection in the pool
+    return max(1, min(concurrency, pool_max_size - 1))
+
+
+def _rerun_key(org_id: str) -> str:
+    return f"evaluate_org_signals:rerun:{org_id}"
+
+
+def _job_id(org_id: str) -> str:
+    return f"evaluate_org_signals:{org_id}"
+
+
+def _follow_up_job_id(org_id: str) -> str:
+    return f"evaluate_org_signals:{org_id}:follow-up"
+
+
+async def enqueue_org_signal_evaluation(
+    redis: ArqRedis, org_id: str, *, job_id: str | None = None
+) -> None:
+    """Schedule evaluate_org_signals for an org.
+
+    If an evaluation is already queued or running, the per-org job id makes the
+    enqueue a no-op; flag the org instead so that evaluation runs once more.
+    """
+    job = await redis.enqueue_job(
+        "evaluate_org_signals",
+        org_id=org_id,
+        _job_id=job_id or _job_id(org_id),
+        _defer_by=SIGNAL_EVAL_DEBOUNCE_SECONDS,
+    )
+    if job is None:
+        await redis.set(_rerun_key(org_id), 1, ex=SIGNAL_EVAL_RERUN_FLAG_TTL_SECONDS)
+
+
+async def evaluate_org_signals(ctx: dict[str, Any], *, org_id: str) -> None:
+    """Background job: evaluate one organization's active signals.
+
+    Enqueued when new scraped data lands for the org, so signals fire within
+    seconds instead of waiting for the next process_signals sweep. If more data
+    landed while it ran, a fresh deferred job is queued to evaluate it.
+    """
+    redis = ctx.get("redis")
+    # This run covers everything written before it starts
+    if redis is not None:
+        await redis.delete(_rerun_key(org_id))
+
+    try:
+        fired_count = await evaluate_signals_for_org(UUID(org_id))
+    except Exception as e:
+        log.error("org_signal_evaluation_error", org_id=org_id, error=str(e), exc_info=True)
+    else:
+        log.info("org_signals_evaluated", org_id=org_id, fired_count=fired_count)
+
+    if redis is not None and await redis.delete(_rerun_key(org_id)):
+        # A new job rather than arq's Retry, which would count toward max_tries for
+        # busy orgs. This job still holds its own id, so queue under the other one.
+        follow_up_id = _follow_up_job_id(org_id)
+        next_id = _job_id(org_id) if ctx.get("job_id") == follow_up_id else follow_up_id
+        await enqueue_org_signal_evaluation(redis, org_id, job_id=next_id)
+
 
 async def process_signals(ctx: dict[str, Any]) -> None:
     """Background job: evaluate all active signals for all organizations.
 
-    This job is scheduled to run every 15 minutes via arq cron.
+    This job is scheduled every 15 minutes via arq cron as a safety net for orgs
+    whose event-driven evaluation was missed or whose data arrived outside a
+    scrape job (manual imports, recovered jobs).
     """
     log.info("signal_processor_started")
 
     pool = await get_pool()
 
     try:
-        # Get all orgs with active signals
-        orgs = await get_all_orgs_with_active_signals(pool)
-
-        total_fired = 0
-        processed_orgs = 0
-
-        for org in orgs:
-            org_id = org["id"]
-            try:
-                fired_count = await evaluate_signals_for_org(org_id)
-                total_fired += fired_count
-                processed_orgs += 1
-
-                log.info(
-                    "org_signals_evaluated",
-                    org_id=str(org_id),
-                    fired_count=fired_count,
-                )
-
-            except Exception as e:
-                log.error(
-                    "org_signal_evaluation_error",
-                    org_id=str(org_id),
-                    error=str(e),
-                    exc_info=True,
-                )
+        # Load every active signal in one query, grouped by org
+        signals_by_org = await get_active_signals_grouped_by_org(pool)
+
+        max_size = pool.get_max_size()
+        sem = asyncio.Semaphore(_org_concurrency(max_size))
+        # Orgs run concurrently and each runs its checks concurrently, so also
+        # bound the checks (one pool connection each) in flight across all orgs
+        check_limit = asyncio.Semaphore(max(1, max_size - 1))
+
+        async def run_one(org_id: UUID, signals: list[Signal]) -> int | None:
+            async with sem:
+                try:
+                    fired_count = await evaluate_signals_for_org(
+                        org_id, signals=signals, shared_check_limit=check_limit
+                    )
+                except Exception as e:
+                    log.error(
+                        "org_signal_evaluation_error",
+                        org_id=str(org_id),
+                        error=str(e),
+                        exc_info=True,
+                    )
+                    return None
+
+            log.info(
+                "org_signals_evaluated",
+                org_id=str(org_id),
+                fired_count=fired_count,
+            )
+            return fired_count
+
+        results = await asyncio.gather(
+            *(run_one(org_id, signals) for org_id, signals in signals_by_org.items())
+        )
+        succeeded = [count for count in results if count is not None]
 
         log.info(
             "signal_processor_completed",
-            processed_orgs=processed_orgs,
-            total_signals_fired=total_fired,
+            processed_orgs=len(succeeded),
+            total_signals_fired=sum(succeeded),
         )
 
     except Exception as e:
@@ -8,7 +8,7 @@ import redis.asyncio as redis
 from src.config.settings import get_settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_wordpress_html() -> str:
     return """
     <html>
@@ -35,7 +35,7 @@ def sample_wordpress_html() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_team_page_html() -> str:
     return """
     <html>
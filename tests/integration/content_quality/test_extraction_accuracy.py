@@ -15,10 +15,10 @@ These tests use real HTTP requests to public sites, so they:
 import asyncio
 
 import pytest
+from selectolax.lexbor import LexborHTMLParser
 
 from src.models.scraping import FetchOptions
 from src.scraping.fetcher.lake_playwright_fetcher import LakePlaywrightFetcher
-from src.scraping.parser.html_parser import HTMLParser
 from src.templates.wordpress import WordPressTemplate
 
 
@@ -36,7 +36,7 @@ class TestBlogExtractionAccuracy:
     @pytest.fixture
     def parser(self):
         """HTML parser for content extraction."""
-        return HTMLParser()
+        return LexborHTMLParser("")
 
     async def test_blog_list_extraction(self, fetcher: LakePlaywrightFetcher):
         """Test extracting blog article list from HubSpot blog.
@@ -56,9 +56,7 @@ class TestBlogExtractionAccuracy:
         assert not result.blocked, "Fetcher detected blocking"
 
         # Parse article links
-        from selectolax.parser import HTMLParser as SelectolaxParser
-
-        tree = SelectolaxParser(result.html)
+        tree = LexborHTMLParser(result.html)
         # HubSpot blog uses <a> tags with href containing "/blog/"
         article_links = [
             node.attributes.get("href")
@@ -89,7 +87,7 @@ class TestBlogExtractionAccuracy:
             ), f"Unexpected URL pattern: {link}"
 
     async def test_article_content_extraction(
-        self, fetcher: LakePlaywrightFetcher, parser: HTMLParser
+        self, fetcher: LakePlaywrightFetcher, parser: LexborHTMLParser
     ):
         """Test extracting content from a specific blog article.
 
@@ -107,9 +105,7 @@ class TestBlogExtractionAccuracy:
         assert len(result.html) > 5000, "Article HTML too short"
 
         # Extract structured content
-        from selectolax.parser import HTMLParser as SelectolaxParser
-
-        tree = SelectolaxParser(result.html)
+        tree = LexborHTMLParser(result.html)
 
         # Title extraction
         title = None
@@ -153,9 +149,7 @@ class TestBlogExtractionAccuracy:
         assert result.status_code == 200
 
         # Use template to detect blog URLs
-        from selectolax.parser import HTMLParser as SelectolaxParser
-
-        tree = SelectolaxParser(result.html)
+        tree = LexborHTMLParser(result.html)
 
         # WordPress template should identify blog article patterns
         article_links = template.extract_blog_urls(tree)
@@ -198,9 +192,7 @@ class TestBlogExtractionAccuracy:
                 if result.status_code != 200:
                     continue
 
-                from selectolax.parser import HTMLParser as SelectolaxParser
-
-                tree = SelectolaxParser(result.html)
+                tree = LexborHTMLParser(result.html)
 
                 # Title extraction
                 title = tree.css_first("h1")
@@ -381,9 +373,7 @@ class TestPricingExtractionAccuracy:
         </div>
         """
 
-        from selectolax.parser import HTMLParser
-
-        tree = HTMLParser(test_html)
+        tree = LexborHTMLParser(test_html)
         plan_name = tree.css_first(".plan-name")
 
         assert plan_name is not None
@@ -0,0 +1,12 @@
+from src.scraping.fetcher.captcha_detector import detect_captcha
+
+
+def test_detects_challenge_markup():
+    assert detect_captcha('<div class="g-recaptcha" data-sitekey="abc"></div>')
+    assert detect_captcha("<title>  JUST A MOMENT...</title>")
+    assert detect_captcha('<script src="https://js.datadome.co/tags.js"></script>')
+
+
+def test_ignores_plain_pages_and_mentions():
+    assert not detect_captcha("<html><body><p>Hello</p></body></html>")
+    assert not detect_captcha("<p>We use a captcha on our signup form.</p>")
@@ -1,3 +1,8 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from src.models.scraping import ScrapingTier
 from src.scraping.fetcher.factory import create_fetcher
 from src.scraping.fetcher.lake_playwright_fetcher import LakePlaywrightFetcher
@@ -10,3 +15,19 @@ class TestCreateFetcher:
 
     def test_playwright_proxy(self):
         assert isinstance(create_fetcher(ScrapingTier.PLAYWRIGHT_PROXY), LakePlaywrightProxyFetcher)
+
+
+class TestSharedFetcherRedisClient:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fetcher_cls", [LakePlaywrightFetcher, LakePlaywrightProxyFetcher])
+    async def test_concurrent_first_use_creates_one_client(self, fetcher_cls):
+        fetcher = fetcher_cls()
+        module = fetcher_cls.__module__
+        with (
+            patch(f"{module}.get_settings", return_value=MagicMock(redis_url="redis://x")),
+            patch(f"{module}.redis.from_url", side_effect=lambda url: MagicMock()) as from_url,
+        ):
+            clients = await asyncio.gather(*(fetcher._get_redis_client() for _ in range(5)))
+
+        from_url.assert_called_once()
+        assert all(client is clients[0] for client in clients)
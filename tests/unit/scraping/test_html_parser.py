@@ -34,6 +34,19 @@ def test_extract_links():
     assert "https://example.com/blog/post-2" in links
 
 
+def test_extract_links_dedupes_across_selectors():
+    html = """
+    <html><body>
+    <h2><a href="/blog/a">A</a></h2>
+    <article><a href="/blog/a">A again</a><a href="https://example.com/blog/a">A abs</a></article>
+    <article><a href="/blog/b">B</a></article>
+    </body></html>
+    """
+    parser = HtmlParser(html, "https://example.com")
+    links = parser.extract_links(selectors=["h2 a", "article a"])
+    assert links == ["https://example.com/blog/a", "https://example.com/blog/b"]
+
+
 def test_extract_categories():
     html = """
     <html><body>
@@ -0,0 +1,19 @@
+from src.scraping.parser.tech_parser import TechParser
+
+
+def test_detects_from_html_case_insensitively():
+    html = '<link href="/WP-Content/x.css"><script src="https://Google-Analytics.com/ga.js">'
+    result = TechParser(html).detect()
+    assert result["platform"] == "WordPress"
+    assert "Google Analytics" in result["analytics"]
+
+
+def test_detects_from_headers():
+    result = TechParser("<html></html>", {"Server": "cloudflare"}).detect()
+    assert "Cloudflare" in result["cdn"]
+
+
+def test_no_signals():
+    result = TechParser("<html><body>plain</body></html>").detect()
+    assert result["platform"] is None
+    assert result["analytics"] == []
@@ -1,3 +1,5 @@
+import pytest
+
 from src.scraping.parser.url_classifier import classify_url, classify_urls
 
 
@@ -7,39 +9,20 @@ def test_classify_blog_url():
     assert result["confidence"] > 0.5
 
 
-def test_classify_blog_insights():
-    result = classify_url("https://example.com/insights/quarterly-report")
-    assert result["data_type"] == "blog_url"
-
-
-def test_classify_contact_url():
-    result = classify_url("https://example.com/contact")
-    assert result["data_type"] == "contact"
-
-
-def test_classify_team_url():
-    result = classify_url("https://example.com/about/team")
-    assert result["data_type"] == "contact"
-
-
-def test_classify_pricing_url():
-    result = classify_url("https://example.com/pricing")
-    assert result["data_type"] == "pricing"
-
-
-def test_classify_resource_url():
-    result = classify_url("https://example.com/resources/whitepapers")
-    assert result["data_type"] == "resource"
-
-
-def test_classify_demo_url():
-    result = classify_url("https://example.com/demo")
-    assert result["data_type"] == "contact"
-
-
-def test_classify_date_based_article():
-    result = classify_url("https://example.com/2024/01/my-article")
-    assert result["data_type"] == "blog_url"
+@pytest.mark.parametrize(
+    ("url", "expected_type"),
+    [
+        ("https://example.com/insights/quarterly-report", "blog_url"),
+        ("https://example.com/contact", "contact"),
+        ("https://example.com/about/team", "contact"),
+        ("https://example.com/pricing", "pricing"),
+        ("https://example.com/resources/whitepapers", "resource"),
+        ("https://example.com/demo", "contact"),
+        ("https://example.com/2024/01/my-article", "blog_url"),
+    ],
+)
+def test_classify(url: str, expected_type: str):
+    assert classify_url(url)["data_type"] == expected_type
 
 
 def test_classify_unknown_url():
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -30,6 +31,24 @@ class TestRateLimiter:
             await r.wait("b.com")
             mock_sleep.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_waits_are_spaced(self):
+        r = RateLimiter()
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await asyncio.gather(*(r.wait("ex.com", delay_ms=1000) for _ in range(3)))
+        delays = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert len(delays) == 2
+        assert delays[0] == pytest.approx(1.0, abs=0.1)
+        assert delays[1] == pytest.approx(2.0, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_default_delay_is_a_floor(self):
+        r = RateLimiter(default_delay_ms=1000)
+        await r.wait("ex.com")
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await r.wait("ex.com")
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.1)
+
     def test_reset(self):
         r = RateLimiter()
         import time
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -77,3 +78,233 @@ class TestSendEmailNotification:
             call_args = mock_client.post.call_args
             assert "http://mail:8025/api/v1/send" in str(call_args)
             assert "user@example.com" in str(call_args)
+
+
+class TestEvaluateSignalsForOrg:
+    @pytest.mark.asyncio
+    async def test_evaluates_concurrently_and_isolates_errors(self):
+        from src.services.signal_evaluator import evaluate_signals_for_org
+
+        ok, failing, quiet = _make_signal(), _make_signal(), _make_signal()
+        outcomes = {ok.id: {"match_count": 1}, quiet.id: None}
+
+        async def fake_evaluate(pool, signal, org_id):
+            if signal.id == failing.id:
+                raise RuntimeError("boom")
+            return outcomes[signal.id]
+
+        pool = MagicMock()
+
+        with (
+            patch("src.services.signal_evaluator.get_pool", AsyncMock(return_value=pool)),
+            patch(
+                "src.services.signal_evaluator.get_active_signals",
+                AsyncMock(return_value=[ok, failing, quiet]),
+            ),
+            patch("src.services.signal_evaluator.evaluate_signal", side_effect=fake_evaluate),
+            patch(
+                "src.services.signal_evaluator.execute_signal_action",
+                AsyncMock(return_value=None),
+            ) as action,
+        ):
+            fired = await evaluate_signals_for_org(uuid4())
+
+        assert fired == 1
+        action.assert_awaited_once_with(pool, ok, {"match_count": 1})
+        # No connection is pinned for the org; each check borrows its own
+        pool.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_caps_checks_in_flight(self):
+        from src.services.signal_evaluator import (
+            MAX_CONCURRENT_CHECKS_PER_ORG,
+            evaluate_signals_for_org,
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_evaluate(pool, signal, org_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return None
+
+        signals = [_make_signal() for _ in range(MAX_CONCURRENT_CHECKS_PER_ORG * 3)]
+        with (
+            patch("src.services.signal_evaluator.get_pool", AsyncMock(return_value=MagicMock())),
+            patch("src.services.signal_evaluator.evaluate_signal", side_effect=fake_evaluate),
+        ):
+            fired = await evaluate_signals_for_org(uuid4(), signals=signals)
+
+        assert fired == 0
+        assert peak == MAX_CONCURRENT_CHECKS_PER_ORG
+
+
+class TestCheckTechStackSignal:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("technology", ["react", "Google Analytics", ""])
+    async def test_matches_technology_as_substring(self, technology):
+        from src.services.signal_evaluator import check_tech_stack_signal
+
+        signal = _make_signal().model_copy(
+            update={
+                "trigger_config": {
+                    "type": "tech_stack_change",
+                    "filters": {"technology": technology},
+                }
+            }
+        )
+        pool = MagicMock()
+        pool.fetch = AsyncMock(return_value=[])
+
+        assert await check_tech_stack_signal(pool, signal, signal.org_id) is None
+
+        # ILIKE '%react%' keeps "react-dom"/"ReactJS" matching, and a multi-word
+        # term stays one phrase rather than becoming an AND of tokens
+        query, _, pattern = pool.fetch.await_args.args
+        assert "tech_text ILIKE $2" in query
+        assert pattern == f"%{technology}%"
+
+
+class TestExecuteSignalAction:
+    @pytest.mark.asyncio
+    async def test_success_records_fire_in_background(self):
+        from src.services.signal_evaluator import _background_tasks, execute_signal_action
+
+        signal = _make_signal()
+        pool = MagicMock()
+
+        with (
+            patch("src.services.signal_evaluator.send_email_notification", AsyncMock()),
+            patch("src.services.signal_evaluator.record_signal_fire", AsyncMock()) as record,
+            patch("src.services.signal_evaluator.publish_signal_event", AsyncMock()),
+        ):
+            await execute_signal_action(pool, signal, {"match_count": 1})
+            await asyncio.gather(*_background_tasks)
+
+        record.assert_awaited_once()
+        assert record.await_args.kwargs["action_status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_post_fire_runs_inline_when_backlog_full(self):
+        from src.services import signal_evaluator
+
+        signal = _make_signal()
+        with (
+            patch.object(signal_evaluator, "MAX_BACKGROUND_TASKS", 0),
+            patch("src.services.signal_evaluator.send_email_notification", AsyncMock()),
+            patch("src.services.signal_evaluator.record_signal_fire", AsyncMock()) as record,
+            patch("src.services.signal_evaluator.publish_signal_event", AsyncMock()),
+        ):
+            await signal_evaluator.execute_signal_action(MagicMock(), signal, {"match_count": 1})
+
+        # Recorded before execute_signal_action returned, with nothing left pending
+        record.assert_awaited_once()
+        assert not signal_evaluator._background_tasks
+
+    @pytest.mark.asyncio
+    async def test_evaluation_waits_for_fire_records(self):
+        from src.services.signal_evaluator import _background_tasks, evaluate_signals_for_org
+
+        signal = _make_signal()
+        with (
+            patch("src.services.signal_evaluator.get_pool", AsyncMock(return_value=MagicMock())),
+            patch(
+                "src.services.signal_evaluator.evaluate_signal",
+                AsyncMock(return_value={"match_count": 1}),
+            ),
+            patch("src.services.signal_evaluator.send_email_notification", AsyncMock()),
+            patch("src.services.signal_evaluator.record_signal_fire", AsyncMock()) as record,
+            patch("src.services.signal_evaluator.publish_signal_event", AsyncMock()),
+        ):
+            fired = await evaluate_signals_for_org(uuid4(), signals=[signal])
+
+        assert fired == 1
+        record.assert_awaited_once()
+        assert not _background_tasks
+
+    @pytest.mark.asyncio
+    async def test_evaluation_does_not_wait_for_other_orgs_records(self):
+        from src.services.signal_evaluator import _background_tasks, evaluate_signals_for_org
+
+        release = asyncio.Event()
+        other_org_task = asyncio.create_task(release.wait())
+        _background_tasks.add(other_org_task)
+        other_org_task.add_done_callback(_background_tasks.discard)
+        try:
+            with (
+                patch(
+                    "src.services.signal_evaluator.get_pool",
+                    AsyncMock(return_value=MagicMock()),
+                ),
+                patch(
+                    "src.services.signal_evaluator.evaluate_signal",
+                    AsyncMock(return_value={"match_count": 1}),
+                ),
+                patch("src.services.signal_evaluator.send_email_notification", AsyncMock()),
+                patch("src.services.signal_evaluator.record_signal_fire", AsyncMock()) as record,
+                patch("src.services.signal_evaluator.publish_signal_event", AsyncMock()),
+            ):
+                fired = await asyncio.wait_for(
+                    evaluate_signals_for_org(uuid4(), signals=[_make_signal()]), timeout=1
+                )
+
+            assert fired == 1
+            record.assert_awaited_once()
+            assert not other_org_task.done()
+        finally:
+            release.set()
+            await other_org_task
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_tasks_added_while_draining(self):
+        from src.services.signal_evaluator import _background_tasks, drain_background_tasks
+
+        finished: list[str] = []
+
+        def track(coro) -> asyncio.Task[None]:
+            task = asyncio.create_task(coro)
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+            return task
+
+        async def late() -> None:
+            await asyncio.sleep(0)
+            finished.append("late")
+
+        async def first() -> None:
+            track(late())
+            finished.append("first")
+
+        track(first())
+        await drain_background_tasks()
+
+        assert finished == ["first", "late"]
+        assert all(task.done() for task in _background_tasks)
+
+    @pytest.mark.asyncio
+    async def test_preloaded_signals_skip_fetch(self):
+        from src.services.signal_evaluator import evaluate_signals_for_org
+
+        signal = _make_signal()
+        pool = MagicMock()
+
+        with (
+            patch("src.services.signal_evaluator.get_pool", AsyncMock(return_value=pool)),
+            patch("src.services.signal_evaluator.get_active_signals", AsyncMock()) as fetch,
+            patch(
+                "src.services.signal_evaluator.evaluate_signal",
+                AsyncMock(return_value={"match_count": 1}),
+            ),
+            patch(
+                "src.services.signal_evaluator.execute_signal_action",
+                AsyncMock(return_value=None),
+            ),
+        ):
+            fired = await evaluate_signals_for_org(uuid4(), signals=[signal])
+
+        assert fired == 1
+        fetch.assert_not_awaited()
@@ -0,0 +1,103 @@
+from src.templates.generic import GenericTemplate
+from src.templates.hubspot import HubSpotTemplate
+
+
+def test_parse_returns_a_fresh_tree(sample_wordpress_html: str):
+    # Trees are mutable; a tree shared between calls could be changed under a caller
+    generic = GenericTemplate()
+    hubspot = HubSpotTemplate()
+    assert generic.parse(sample_wordpress_html) is not hubspot.parse(sample_wordpress_html)
+
+
+def test_generic_extract_blog_urls(sample_wordpress_html: str):
+    template = GenericTemplate()
+    urls = template.extract_blog_urls(sample_wordpress_html, "https://example.com")
+    assert urls == [
+        "https://example.com/blog/test-post-1",
+        "https://example.com/blog/test-post-2",
+    ]
+
+
+def test_match_signals_case_insensitive():
+    template = HubSpotTemplate()
+    assert template.detect_platform('<script src="//JS.HS-Scripts.com/1.js">', "https://x.com")
+    assert not template.detect_platform("<html><body>Hello</body></html>", "https://x.com")
+
+
+def test_match_signals_without_signals():
+    assert not GenericTemplate().match_signals("<html>hubspot wp-content</html>")
+
+
+def test_collect_links_dedupes_in_document_order():
+    template = GenericTemplate()
+    html = (
+        '<a class="a" href="/two">2</a><h2><a href="/one">1</a></h2>'
+        '<a class="a" href="/one">1 again</a><a class="a">no href</a>'
+    )
+    tree = template.parse(html)
+    assert template.collect_links(tree, ["h2 a", "a.a"], "https://x.com") == [
+        "https://x.com/two",
+        "https://x.com/one",
+    ]
+    assert template.collect_links(tree, [], "https://x.com") == []
+
+
+def test_resolve_url_matches_urljoin():
+    from urllib.parse import urljoin
+
+    template = GenericTemplate()
+    bases = ["https://example.com", "https://example.com/blog/", "http://a.com/x/y?q=1#f"]
+    hrefs = [
+        "/a/b?c=1#d",
+        "//cdn.example.com/app.js",
+        "https://other.com/p",
+        "post/1",
+        "../up",
+        "#top",
+        "/a/../b",
+        "/pa\nth",
+        "/a?",
+        "/a#",
+        "/a;",
+        "/a?#f",
+        "https://other.com/p?",
+        "///x",
+    ]
+    for base in bases:
+        for href in hrefs:
+            assert template.resolve_url(href, base) == urljoin(base, href)
+
+
+def test_resolve_url_fuzzed_against_urljoin():
+    import random
+    from urllib.parse import urljoin
+
+    template = GenericTemplate()
+    pieces = [
+        "http://", "https://", "//", "/", "a", "b.c", ".", "..", "?", "#", "=", "&",
+        "%2F", " ", ":", "@", ";", "\t", "[::1]", "HTTP://", "\\", "é", "+",
+    ]
+    bases = [
+        "https://example.com",
+        "https://example.com/blog/",
+        "http://a.com/x/y?q=1#f",
+        "https://u:p@h.com:8080/p",
+        "ftp://f.com/d/",
+    ]
+    rng = random.Random(0)
+    for _ in range(20_000):
+        href = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 6)))
+        base = rng.choice(bases)
+        assert template.resolve_url(href, base) == urljoin(base, href), (href, base)
+
+
+def test_first_text_respects_selector_priority():
+    template = GenericTemplate()
+    tree = template.parse('<p class="b">  second \n pick </p><h1 class="a"></h1><p class="c">x</p>')
+    assert template.first_text(tree, [".a", ".b", ".c"]) == "second pick"
+    assert template.first_text(tree, [".missing"]) is None
+
+
+def test_config_built_once_per_template():
+    template = HubSpotTemplate()
+    assert template.config is template.config
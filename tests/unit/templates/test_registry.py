@@ -0,0 +1,30 @@
+from src.templates.registry import detect_template
+
+
+def test_detect_wordpress(sample_wordpress_html: str):
+    assert detect_template(sample_wordpress_html, "https://example.com").config.id == "wordpress"
+
+
+def test_detect_hubspot_case_insensitive():
+    html = '<html><script src="//JS.HS-SCRIPTS.COM/123.js"></script></html>'
+    assert detect_template(html, "https://example.com").config.id == "hubspot"
+
+
+def test_detect_respects_priority():
+    # HubSpot signal appears first, but WordPress has detection priority
+    html = '<script src="//js.hs-scripts.com/1.js"></script><link href="/wp-content/x.css">'
+    assert detect_template(html, "https://example.com").config.id == "wordpress"
+
+
+def test_detect_falls_back_to_generic():
+    assert detect_template("<html><body>Hi</body></html>", "https://x.com").config.id == "generic"
+
+
+def test_detect_scans_whole_document():
+    # Two pages of one site sharing a long <head>: markers past it still count
+    head = "<html><head>" + " " * 8192
+    wp = head + '<link href="/wp-content/x.css">'
+    plain = head + "<p>no signals</p>"
+
+    assert detect_template(wp, "https://same.example/a").config.id == "wordpress"
+    assert detect_template(plain, "https://same.example/b").config.id == "generic"
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from src.templates.wordpress import WordPressTemplate
 
 
@@ -26,3 +28,15 @@ def test_wordpress_config():
     assert config.name == "WordPress"
     assert "wp-content" in config.platform_signals
     assert config.pagination.type == "numbered"
+
+
+def test_wordpress_extract_article_parses_once(sample_wordpress_html: str):
+    template = WordPressTemplate()
+    with patch.object(WordPressTemplate, "parse", wraps=template.parse) as parse:
+        template.extract_article(sample_wordpress_html, "https://example.com/blog/test-post-1")
+    parse.assert_called_once_with(sample_wordpress_html)
+
+
+def test_wordpress_detect_platform_case_insensitive():
+    template = WordPressTemplate()
+    assert template.detect_platform('<link href="/WP-Content/themes/x.css">', "https://x.com")
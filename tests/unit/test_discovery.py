@@ -1,9 +1,11 @@
 """Unit tests for the discovery pipeline (LakeCurrent client, domain extractor, models)."""
 
-from unittest.mock import patch
+import json
+from collections import deque
 
 import httpx
 import pytest
+from pydantic import ValidationError
 
 from src.models.discovery import (
     DiscoveryJobInput,
@@ -39,50 +41,22 @@ MOCK_SEARCH_RESPONSE = {
 }
 
 
-def _mock_response(status_code: int, **kwargs) -> httpx.Response:
-    """Create a mock httpx.Response with a request attached."""
-    request = httpx.Request("GET", "http://test")
-    return httpx.Response(status_code, request=request, **kwargs)
+def _json_bytes(body: dict) -> bytes:
+    return json.dumps(body).encode()
 
 
-async def test_lakecurrent_search():
-    """Test single search call parses results and extracts domains."""
-    mock_response = _mock_response(200, json=MOCK_SEARCH_RESPONSE)
-
-    with patch.object(httpx.AsyncClient, "get", return_value=mock_response):
-        client = LakeCurrentClient(base_url="http://localhost:8001")
-        resp = await client.search("insurtech startups")
-        await client.close()
-
-    assert resp.query == "insurtech startups"
-    assert len(resp.results) == 2
-    assert resp.results[0].domain == "example.com"
-    assert resp.results[0].title == "Example InsurTech"
-    assert resp.results[1].domain == "acme.io"
-    assert resp.suggestions == ["insurtech companies 2024"]
-
-
-async def test_lakecurrent_search_strips_www():
-    """Test that www. prefix is stripped from domains."""
-    data = {
+# Mock bodies are serialized once at import; tests hand the bytes to httpx.Response
+_MOCK_SEARCH_BYTES = _json_bytes(MOCK_SEARCH_RESPONSE)
+_WWW_SEARCH_BYTES = _json_bytes(
+    {
         "query": "test",
         "results": [{"url": "https://www.bigcorp.com/page", "title": "Big Corp", "snippet": "x"}],
         "suggestions": [],
         "answers": [],
     }
-    mock_response = _mock_response(200, json=data)
-
-    with patch.object(httpx.AsyncClient, "get", return_value=mock_response):
-        client = LakeCurrentClient(base_url="http://localhost:8001")
-        resp = await client.search("test")
-        await client.close()
-
-    assert resp.results[0].domain == "bigcorp.com"
-
-
-async def test_lakecurrent_search_pages():
-    """Test multi-page search fetches until exhausted."""
-    page1 = {
+)
+_PAGE1_BYTES = _json_bytes(
+    {
         "query": "test",
         "results": [
             {"url": "https://a.com/1", "title": "A", "snippet": "a"},
@@ -91,7 +65,9 @@ async def test_lakecurrent_search_pages():
         "suggestions": [],
         "answers": [],
     }
-    page2 = {
+)
+_PAGE2_BYTES = _json_bytes(
+    {
         "query": "test",
         "results": [
             {"url": "https://c.com/1", "title": "C", "snippet": "c"},
@@ -99,42 +75,97 @@ async def test_lakecurrent_search_pages():
         "suggestions": [],
         "answers": [],
     }
+)
+_HEALTH_BYTES = _json_bytes({"status": "healthy", "components": {"LakeFilter": "ok"}})
+
+
+def _json_response(status_code: int, body: bytes) -> httpx.Response:
+    return httpx.Response(status_code, content=body, headers={"content-type": "application/json"})
+
+
+class _QueuedResponses:
+    """MockTransport handler that answers each request with the next queued response."""
+
+    def __init__(self) -> None:
+        self.queue: deque[httpx.Response] = deque()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self.queue.popleft()
+
+
+@pytest.fixture(scope="module")
+def _handler() -> _QueuedResponses:
+    return _QueuedResponses()
+
+
+@pytest.fixture(scope="module")
+async def lakecurrent_client(_handler):
+    """One client for the module, routed through an in-process transport instead of the network."""
+    client = LakeCurrentClient(
+        base_url="http://localhost:8001", transport=httpx.MockTransport(_handler)
+    )
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def responses(_handler) -> deque[httpx.Response]:
+    """Per-test response queue for the shared client's transport."""
+    _handler.queue.clear()
+    return _handler.queue
+
+
+async def test_lakecurrent_search(lakecurrent_client, responses):
+    """Test single search call parses results and extracts domains."""
+    responses.append(_json_response(200, _MOCK_SEARCH_BYTES))
+
+    resp = await lakecurrent_client.search("insurtech startups")
+
+    assert resp.query == "insurtech startups"
+    assert len(resp.results) == 2
+    assert resp.results[0].domain == "example.com"
+    assert resp.results[0].title == "Example InsurTech"
+    assert resp.results[1].domain == "acme.io"
+    assert resp.suggestions == ["insurtech companies 2024"]
 
-    responses = iter([_mock_response(200, json=page1), _mock_response(200, json=page2)])
 
-    with patch.object(httpx.AsyncClient, "get", side_effect=lambda *a, **kw: next(responses)):
-        client = LakeCurrentClient(base_url="http://localhost:8001")
-        results = await client.search_pages("test", pages=3, per_page=2)
-        await client.close()
+async def test_lakecurrent_search_strips_www(lakecurrent_client, responses):
+    """Test that www. prefix is stripped from domains."""
+    responses.append(_json_response(200, _WWW_SEARCH_BYTES))
+
+    resp = await lakecurrent_client.search("test")
+
+    assert resp.results[0].domain == "bigcorp.com"
+
+
+async def test_lakecurrent_search_pages(lakecurrent_client, responses):
+    """Test multi-page search fetches until exhausted."""
+    responses.extend([_json_response(200, _PAGE1_BYTES), _json_response(200, _PAGE2_BYTES)])
+
+    results = await lakecurrent_client.search_pages("test", pages=3, per_page=2)
 
     # Should stop after page 2 (1 result < per_page of 2)
     assert len(results) == 3
     assert results[0].domain == "a.com"
     assert results[2].domain == "c.com"
+    assert not responses
 
 
-async def test_lakecurrent_health():
+async def test_lakecurrent_health(lakecurrent_client, responses):
     """Test health check call."""
-    health_data = {"status": "healthy", "components": {"LakeFilter": "ok"}}
-    mock_response = _mock_response(200, json=health_data)
+    responses.append(_json_response(200, _HEALTH_BYTES))
 
-    with patch.object(httpx.AsyncClient, "get", return_value=mock_response):
-        client = LakeCurrentClient(base_url="http://localhost:8001")
-        result = await client.health()
-        await client.close()
+    result = await lakecurrent_client.health()
 
     assert result["status"] == "healthy"
 
 
-async def test_lakecurrent_search_http_error():
+async def test_lakecurrent_search_http_error(lakecurrent_client, responses):
     """Test that HTTP errors are raised."""
-    mock_response = _mock_response(502, text="Bad Gateway")
+    responses.append(httpx.Response(502, text="Bad Gateway"))
 
-    with patch.object(httpx.AsyncClient, "get", return_value=mock_response):
-        client = LakeCurrentClient(base_url="http://localhost:8001")
-        with pytest.raises(httpx.HTTPStatusError):
-            await client.search("test")
-        await client.close()
+    with pytest.raises(httpx.HTTPStatusError):
+        await lakecurrent_client.search("test")
 
 
 # --------------- Domain Extractor ---------------
@@ -208,20 +239,19 @@ def test_discovery_job_input_defaults():
     assert input.priority == 5
 
 
-def test_discovery_job_input_validation():
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"query": "", "data_types": ["contact"]},  # empty query
+        {"query": "test", "data_types": []},  # empty data_types
+        {"query": "test", "data_types": ["contact"], "search_pages": 20},  # exceeds max 10
+    ],
+    ids=["empty_query", "empty_data_types", "too_many_pages"],
+)
+def test_discovery_job_input_validation(kwargs: dict):
     """Test DiscoveryJobInput rejects invalid values."""
-    with pytest.raises(Exception):
-        DiscoveryJobInput(query="", data_types=["contact"])  # empty query
-
-    with pytest.raises(Exception):
-        DiscoveryJobInput(query="test", data_types=[])  # empty data_types
-
-    with pytest.raises(Exception):
-        DiscoveryJobInput(
-            query="test",
-            data_types=["contact"],
-            search_pages=20,  # exceeds max 10
-        )
+    with pytest.raises(ValidationError):
+        DiscoveryJobInput(**kwargs)
 
 
 def test_tracked_search_input_defaults():
@@ -241,7 +271,5 @@ def test_tracked_search_input_invalid_frequency():
 
 def test_discovery_status_enum():
     """Test DiscoveryStatus enum values."""
-    assert DiscoveryStatus.SEARCHING == "searching"
-    assert DiscoveryStatus.SCRAPING == "scraping"
-    assert DiscoveryStatus.COMPLETED == "completed"
-    assert DiscoveryStatus.FAILED == "failed"
+    expected = {"searching", "scraping", "completed", "failed"}
+    assert expected <= {status.value for status in DiscoveryStatus}
@@ -0,0 +1,35 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.utils.retry import retry_async
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success():
+    fn = AsyncMock(side_effect=[ValueError("boom"), "ok"])
+    with patch("src.utils.retry.asyncio.sleep", new=AsyncMock()):
+        assert await retry_async(fn, max_retries=2) == "ok"
+    assert fn.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_raises_last_error_after_max_retries():
+    fn = AsyncMock(side_effect=ValueError("boom"))
+    with patch("src.utils.retry.asyncio.sleep", new=AsyncMock()):
+        with pytest.raises(ValueError, match="boom"):
+            await retry_async(fn, max_retries=2)
+    assert fn.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_backoff_is_jittered_and_capped():
+    fn = AsyncMock(side_effect=ValueError("boom"))
+    sleep = AsyncMock()
+    with patch("src.utils.retry.asyncio.sleep", new=sleep):
+        with pytest.raises(ValueError):
+            await retry_async(fn, max_retries=4, base_delay=1.0, max_delay=4.0)
+
+    delays = [call.args[0] for call in sleep.await_args_list]
+    for delay, ceiling in zip(delays, [1.0, 2.0, 4.0, 4.0], strict=True):
+        assert ceiling * 0.5 <= delay <= ceiling
@@ -0,0 +1,30 @@
+import sys
+
+import pytest
+
+from src.utils.shell import run_command
+
+
+@pytest.mark.asyncio
+async def test_returns_output_and_returncode():
+    stdout, stderr, code = await run_command(
+        sys.executable, "-c", "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+    )
+    assert stdout == "out\n"
+    assert stderr == "err\n"
+    assert code == 3
+
+
+@pytest.mark.asyncio
+async def test_max_output_bytes_caps_kept_output():
+    stdout, _, code = await run_command(
+        sys.executable, "-c", "print('x' * 200_000)", max_output_bytes=1000
+    )
+    assert stdout == "x" * 1000
+    assert code == 0
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_process():
+    with pytest.raises(TimeoutError):
+        await run_command(sys.executable, "-c", "import time; time.sleep(10)", timeout=1)
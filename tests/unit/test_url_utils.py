@@ -0,0 +1,65 @@
+import pytest
+
+from src.utils.url import extract_domain, is_valid_scrape_url, normalize_url
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/",
+        "https://example.com/blog/post",
+        "https://example.com/docs/page.html",
+        "https://example.com/app.js/route",
+    ],
+)
+def test_is_valid_scrape_url_accepts_pages(url: str):
+    assert is_valid_scrape_url(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "",
+        "#section",
+        "mailto:a@b.com",
+        "javascript:void(0)",
+        "https://example.com/file.PDF",
+        "https://example.com/img/logo.png?v=2",
+        "https://example.com/feed.rss",
+    ],
+)
+def test_is_valid_scrape_url_rejects_non_pages(url: str):
+    assert not is_valid_scrape_url(url)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://example.com", "https://example.com/"),
+        ("https://example.com/blog/", "https://example.com/blog"),
+        ("https://example.com/a/?page=2", "https://example.com/a?page=2"),
+        ("https://example.com:8443/A/B", "https://example.com:8443/A/B"),
+        ("HTTPS://Example.COM/Path#top", "https://example.com/Path"),
+        ("https://example.com/a;v=1", "https://example.com/a;v=1"),
+        ("https://example.com/x?", "https://example.com/x"),
+    ],
+)
+def test_normalize_url(url: str, expected: str):
+    assert normalize_url(url) == expected
+
+
+def test_normalize_url_resolves_relative():
+    url = normalize_url("../post/", "https://example.com/blog/x/")
+    assert url == "https://example.com/blog/post"
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www.Example.com/path", "example.com"),
+        ("https://blog.example.com", "blog.example.com"),
+        ("example.com/about", "example.com"),
+    ],
+)
+def test_extract_domain(url: str, expected: str):
+    assert extract_domain(url) == expected
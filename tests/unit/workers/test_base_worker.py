@@ -44,6 +44,30 @@ class TestBaseWorkerWithoutPool:
 
         assert result.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_reuses_fetcher_and_closes_it(self):
+        from src.workers.base import BaseWorker
+
+        class W(BaseWorker):
+            async def execute(self, urls):
+                return []
+
+        worker = W(domain="example.com", job_id=str(uuid4()))
+        mock_fetcher = MagicMock()
+        mock_fetcher.fetch = AsyncMock(return_value=_make_result())
+        mock_fetcher.close = AsyncMock()
+
+        with patch(
+            "src.workers.base.create_fetcher", return_value=mock_fetcher
+        ) as mock_factory:
+            await worker.fetch_page("https://example.com/a")
+            await worker.fetch_page("https://example.com/b")
+            await worker.close()
+
+        mock_factory.assert_called_once_with(ScrapingTier.PLAYWRIGHT)
+        assert mock_fetcher.fetch.await_count == 2
+        mock_fetcher.close.assert_awaited_once()
+
 
 class TestBaseWorkerWithPool:
     @pytest.fixture
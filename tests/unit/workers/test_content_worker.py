@@ -0,0 +1,148 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.scraped_data import DataType
+from src.models.template import TemplateConfig
+
+
+def _make_worker(**kwargs):
+    from src.workers.content_worker import ContentWorker
+
+    return ContentWorker(domain="example.com", job_id=str(uuid4()), **kwargs)
+
+
+class TestContentWorkerConcurrency:
+    @pytest.mark.asyncio
+    async def test_processes_urls_concurrently_within_limit(self):
+        worker = _make_worker(template=TemplateConfig(id="t", name="t", max_concurrent_pages=2))
+        in_flight = 0
+        peak = 0
+
+        async def fake_process(url, data_type, data_types):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if url.endswith("/bad"):
+                raise RuntimeError("boom")
+            return [SimpleNamespace(url=url, data_type=DataType.PAGE, metadata={})]
+
+        urls = [{"url": f"https://example.com/{i}"} for i in range(5)]
+        urls.append({"url": "https://example.com/bad"})
+        urls.append({"url": "https://example.com/0"})  # duplicate
+
+        with patch.object(worker, "_process_url", side_effect=fake_process) as mock_process:
+            results = await worker.execute(urls, ["page"])
+
+        assert peak == 2
+        assert mock_process.await_count == 6
+        assert [r.url for r in results] == [f"https://example.com/{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_stops_fetching_after_cancel(self):
+        worker = _make_worker(pool=object())
+        worker._escalation = None
+
+        with (
+            patch(
+                "src.workers.content_worker.is_job_cancelled",
+                AsyncMock(side_effect=[False, True, True]),
+            ),
+            patch.object(worker, "_process_url", AsyncMock(return_value=[])) as mock_process,
+        ):
+            await worker.execute(
+                [{"url": f"https://example.com/{i}", "data_type": DataType.PAGE} for i in range(3)],
+                ["page"],
+            )
+
+        assert mock_process.await_count == 1
+
+
+class TestContentWorkerExportBatching:
+    @pytest.mark.asyncio
+    async def test_records_are_inserted_in_batches(self):
+        from src.workers import content_worker
+
+        worker = _make_worker()
+
+        async def fake_process(url, data_type, data_types):
+            await worker._queue_export([{"url": url}] * 30)
+            return []
+
+        urls = [{"url": f"https://example.com/{i}"} for i in range(5)]
+        with (
+            patch.object(worker, "_process_url", side_effect=fake_process),
+            patch.object(worker, "export_results", AsyncMock(return_value=0)) as export,
+        ):
+            await worker.execute(urls, ["page"])
+
+        sizes = [len(call.args[0]) for call in export.await_args_list]
+        assert sum(sizes) == 150
+        assert sizes[0] >= content_worker._EXPORT_BATCH_SIZE
+        assert len(sizes) == 2  # one full batch + the final flush
+
+    @pytest.mark.asyncio
+    async def test_export_buffer_usable_before_execute(self):
+        worker = _make_worker()
+
+        with patch.object(worker, "export_results", AsyncMock(return_value=0)) as export:
+            await worker._queue_export([{"url": "https://example.com/a"}])
+            await worker._flush_exports()
+
+        export.assert_awaited_once_with([{"url": "https://example.com/a"}])
+
+    @pytest.mark.asyncio
+    async def test_execute_starts_from_clean_state(self):
+        worker = _make_worker()
+        worker._cancelled = True
+        worker._urls_processed = 7
+        worker._pending_exports.append({"url": "https://example.com/stale"})
+
+        with (
+            patch.object(worker, "_process_url", AsyncMock(return_value=[])) as mock_process,
+            patch.object(worker, "export_results", AsyncMock(return_value=0)) as export,
+        ):
+            await worker.execute([{"url": "https://example.com/a"}], ["page"])
+
+        mock_process.assert_awaited_once()
+        assert worker._urls_processed == 1
+        export.assert_not_awaited()
+
+
+class TestContentWorkerTinyPages:
+    @pytest.mark.asyncio
+    async def test_page_below_floor_is_skipped_before_parsing(self):
+        from src.models.scraping import FetchResult, ScrapingTier
+
+        worker = _make_worker()
+        html = "<html><body>Moved</body></html>"
+        fetch_result = FetchResult(
+            url="https://example.com/a",
+            status_code=200,
+            html=html,
+            tier_used=ScrapingTier.PLAYWRIGHT,
+            cost_usd=0.0,
+            duration_ms=1,
+        )
+
+        with (
+            patch.object(worker, "fetch_page", AsyncMock(return_value=fetch_result)),
+            patch(
+                "src.workers.content_worker.get_settings",
+                return_value=SimpleNamespace(min_content_html_bytes=512),
+            ),
+            patch("src.workers.content_worker.HtmlParser") as parser_cls,
+            patch.object(worker, "log") as mock_log,
+        ):
+            records = await worker._process_url("https://example.com/a", DataType.PAGE, ["page"])
+
+        assert records == []
+        parser_cls.assert_not_called()
+        mock_log.warning.assert_called_once_with(
+            "tiny_html", url="https://example.com/a", size=len(html)
+        )
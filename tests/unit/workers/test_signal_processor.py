@@ -0,0 +1,277 @@
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+
+class TestProcessSignals:
+    @pytest.mark.asyncio
+    async def test_evaluates_every_org_and_skips_failures(self):
+        from src.workers.signal_processor import process_signals
+
+        org_ids = [uuid4(), uuid4(), uuid4()]
+        pool = MagicMock()
+        pool.get_max_size.return_value = 10
+
+        async def evaluate(org_id, signals, shared_check_limit):
+            if org_id == org_ids[1]:
+                raise RuntimeError("boom")
+            return 2
+
+        with (
+            patch("src.workers.signal_processor.get_pool", AsyncMock(return_value=pool)),
+            patch(
+                "src.workers.signal_processor.get_settings",
+                return_value=SimpleNamespace(signal_org_concurrency=0),
+            ),
+            patch(
+                "src.workers.signal_processor.get_active_signals_grouped_by_org",
+                AsyncMock(return_value={org_id: [MagicMock()] for org_id in org_ids}),
+            ),
+            patch(
+                "src.workers.signal_processor.evaluate_signals_for_org",
+                AsyncMock(side_effect=evaluate),
+            ) as mock_eval,
+            patch("src.workers.signal_processor.log") as mock_log,
+        ):
+            await process_signals({})
+
+        assert mock_eval.await_count == 3
+        # Each org is evaluated with its preloaded signals
+        for call in mock_eval.await_args_list:
+            assert len(call.kwargs["signals"]) == 1
+        mock_log.info.assert_any_call(
+            "signal_processor_completed", processed_orgs=2, total_signals_fired=4
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrency_setting_caps_orgs_in_flight(self):
+        from src.workers.signal_processor import process_signals
+
+        pool = MagicMock()
+        pool.get_max_size.return_value = 50
+        in_flight = 0
+        peak = 0
+
+        async def evaluate(org_id, signals, shared_check_limit):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return 0
+
+        with (
+            patch("src.workers.signal_processor.get_pool", AsyncMock(return_value=pool)),
+            patch(
+                "src.workers.signal_processor.get_settings",
+                return_value=SimpleNamespace(signal_org_concurrency=2),
+            ),
+            patch(
+                "src.workers.signal_processor.get_active_signals_grouped_by_org",
+                AsyncMock(return_value={uuid4(): [] for _ in range(6)}),
+            ),
+            patch(
+                "src.workers.signal_processor.evaluate_signals_for_org",
+                AsyncMock(side_effect=evaluate),
+            ),
+        ):
+            await process_signals({})
+
+        assert peak == 2
+
+    @pytest.mark.parametrize(
+        ("setting", "pool_max_size", "expected"),
+        [
+            (0, 10, 2),  # derived from the pool size
+            (3, 10, 3),
+            (10, 10, 9),  # clamped below the pool size
+            (50, 10, 9),
+            (0, 1, 1),
+        ],
+    )
+    def test_org_concurrency_is_clamped(self, setting, pool_max_size, expected):
+        from src.workers.signal_processor import _org_concurrency
+
+        with patch(
+            "src.workers.signal_processor.get_settings",
+            return_value=SimpleNamespace(signal_org_concurrency=setting),
+        ):
+            assert _org_concurrency(pool_max_size) == expected
+
+    def test_negative_org_concurrency_rejected(self):
+        from pydantic import ValidationError
+
+        from src.config.settings import Settings
+
+        with pytest.raises(ValidationError):
+            Settings(signal_org_concurrency=-1)
+
+
+class _FakePool:
+    """Pool stand-in that fails like a real one would if over-borrowed."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.in_use = 0
+        self.peak = 0
+
+    def get_max_size(self) -> int:
+        return self.max_size
+
+    async def fetch(self, query, *args):
+        if self.in_use >= self.max_size:
+            raise RuntimeError("pool exhausted")
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+        try:
+            await asyncio.sleep(0)
+            return []
+        finally:
+            self.in_use -= 1
+
+
+def _funding_signal(org_id):
+    from src.models.signals import Signal
+
+    now = datetime.now(UTC)
+    return Signal(
+        id=uuid4(),
+        org_id=org_id,
+        name="Funding",
+        description=None,
+        is_active=True,
+        trigger_config={"type": "funding_round"},
+        condition_config=None,
+        action_config={"type": "email"},
+        created_by=None,
+        created_at=now,
+        updated_at=now,
+        last_fired_at=None,
+        fire_count=0,
+    )
+
+
+class TestProcessSignalsPoolBound:
+    @pytest.mark.asyncio
+    async def test_checks_in_flight_stay_below_pool_size(self):
+        from src.workers.signal_processor import process_signals
+
+        pool = _FakePool(max_size=3)
+        org_ids = [uuid4() for _ in range(5)]
+        signals_by_org = {org_id: [_funding_signal(org_id) for _ in range(6)] for org_id in org_ids}
+
+        with (
+            patch("src.workers.signal_processor.get_pool", AsyncMock(return_value=pool)),
+            patch("src.services.signal_evaluator.get_pool", AsyncMock(return_value=pool)),
+            patch(
+                "src.workers.signal_processor.get_settings",
+                return_value=SimpleNamespace(signal_org_concurrency=50),
+            ),
+            patch(
+                "src.workers.signal_processor.get_active_signals_grouped_by_org",
+                AsyncMock(return_value=signals_by_org),
+            ),
+            patch("src.services.signal_evaluator.log") as eval_log,
+            patch("src.workers.signal_processor.log") as mock_log,
+        ):
+            await asyncio.wait_for(process_signals({}), timeout=5)
+
+        eval_log.error.assert_not_called()
+        assert pool.peak == pool.max_size - 1
+        mock_log.info.assert_any_call(
+            "signal_processor_completed", processed_orgs=5, total_signals_fired=0
+        )
+
+
+class TestEvaluateOrgSignals:
+    @pytest.mark.asyncio
+    async def test_evaluates_single_org(self):
+        from src.workers.signal_processor import evaluate_org_signals
+
+        org_id = uuid4()
+        with (
+            patch(
+                "src.workers.signal_processor.evaluate_signals_for_org",
+                AsyncMock(return_value=1),
+            ) as mock_eval,
+            patch("src.workers.signal_processor.log") as mock_log,
+        ):
+            await evaluate_org_signals({}, org_id=str(org_id))
+
+        mock_eval.assert_awaited_once_with(org_id)
+        mock_log.info.assert_called_once_with(
+            "org_signals_evaluated", org_id=str(org_id), fired_count=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_enqueue_is_keyed_per_org(self):
+        from src.workers.signal_processor import enqueue_org_signal_evaluation
+
+        redis = AsyncMock()
+        await enqueue_org_signal_evaluation(redis, "org-1")
+
+        kwargs = redis.enqueue_job.await_args.kwargs
+        assert redis.enqueue_job.await_args.args == ("evaluate_org_signals",)
+        assert kwargs["org_id"] == "org-1"
+        assert kwargs["_job_id"] == "evaluate_org_signals:org-1"
+        redis.set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_flags_rerun_when_already_queued_or_running(self):
+        from src.workers.signal_processor import enqueue_org_signal_evaluation
+
+        redis = AsyncMock()
+        redis.enqueue_job.return_value = None  # arq: job id already in use
+        await enqueue_org_signal_evaluation(redis, "org-1")
+
+        assert redis.set.await_args.args[:2] == ("evaluate_org_signals:rerun:org-1", 1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("flag_set_during_run", "reruns"), [(0, False), (1, True)])
+    async def test_reruns_when_data_landed_during_run(self, flag_set_during_run, reruns):
+        from src.workers.signal_processor import evaluate_org_signals
+
+        org_id = str(uuid4())
+        redis = AsyncMock()
+        # Cleared at start, then checked (and cleared) again after the run
+        redis.delete.side_effect = [1, flag_set_during_run]
+        with patch(
+            "src.workers.signal_processor.evaluate_signals_for_org", AsyncMock(return_value=0)
+        ):
+            await evaluate_org_signals(
+                {"redis": redis, "job_id": f"evaluate_org_signals:{org_id}"}, org_id=org_id
+            )
+
+        assert redis.delete.await_count == 2
+        if reruns:
+            kwargs = redis.enqueue_job.await_args.kwargs
+            assert kwargs["_job_id"] == f"evaluate_org_signals:{org_id}:follow-up"
+            assert kwargs["_defer_by"] > 0
+        else:
+            redis.enqueue_job.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_busy_org_keeps_rerunning_past_arq_max_tries(self):
+        from src.workers.signal_processor import evaluate_org_signals
+
+        org_id = str(uuid4())
+        redis = AsyncMock()
+        # Data lands during every run
+        redis.delete.return_value = 1
+        job_id = f"evaluate_org_signals:{org_id}"
+        with patch(
+            "src.workers.signal_processor.evaluate_signals_for_org", AsyncMock(return_value=0)
+        ) as mock_eval:
+            for _ in range(8):
+                await evaluate_org_signals({"redis": redis, "job_id": job_id}, org_id=org_id)
+                # Each rerun is a fresh job (job_try 1), alternating between the two ids
+                next_id = redis.enqueue_job.await_args.kwargs["_job_id"]
+                assert next_id != job_id
+                job_id = next_id
+
+        assert mock_eval.await_count == 8
+        assert redis.enqueue_job.await_count == 8